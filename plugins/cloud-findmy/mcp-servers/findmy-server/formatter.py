@@ -6,28 +6,50 @@ from datetime import datetime
 from typing import Dict, List
 
 
+_STATUS_MAP = {
+    "200": "Online",
+    "203": "Offline",
+    "201": "Partial",
+}
+
+# (location key, line template) for optional location fields, in display order
+_LOCATION_FIELDS = (
+    ("altitude", "Altitude: {} meters"),
+    ("floorLevel", "Floor Level: {}"),
+    ("horizontalAccuracy", "Accuracy: {} meters"),
+    ("positionType", "Position Type: {}"),
+)
+
+_LOCATION_WARNINGS = (
+    ("isOld", "⚠️ Location data may be outdated"),
+    ("isInaccurate", "⚠️ Location may be inaccurate"),
+)
+
+_DEVICE_FMT = (
+    "# {name} ({display_name})\n"
+    "  - Name: {name}\n"
+    "  - Display Name: {display_name}\n"
+    "  - Discovery ID: {discovery_id}\n"
+    "  - Device Class: {device_class}\n"
+    "\n"
+)
+
+
 def format_device_list(devices: List[Dict], is_cached: bool = False) -> str:
     """Format device list for display."""
     cache_label = " (Cached)" if is_cached else ""
-    lines = [f"== Available Devices{cache_label} ==", ""]
+    parts = [f"== Available Devices{cache_label} ==\n\n"]
 
     for device in devices:
-        name = device["name"]
-        display_name = device.get("display_name", device.get("model", "Unknown"))
-        discovery_id = device.get("discovery_id", "Unknown")
-        device_class = device.get("device_class", "Unknown")
-
-        lines.extend([
-            f"# {name} ({display_name})",
-            f"  - Name: {name}",
-            f"  - Display Name: {display_name}",
-            f"  - Discovery ID: {discovery_id}",
-            f"  - Device Class: {device_class}",
-            ""
-        ])
-
-    lines.append("Use get_device_info with the Discovery ID to get comprehensive details.")
-    return "\n".join(lines)
+        parts.append(_DEVICE_FMT.format(
+            name=device["name"],
+            display_name=device.get("display_name", device.get("model", "Unknown")),
+            discovery_id=device.get("discovery_id", "Unknown"),
+            device_class=device.get("device_class", "Unknown"),
+        ))
+
+    parts.append("Use get_device_info with the Discovery ID to get comprehensive details.")
+    return "".join(parts)
 
 
 def format_device_info(device: Dict, discovery_id: str) -> str:
@@ -101,15 +123,7 @@ def format_reset_status(timeout_minutes: int) -> str:
 
 def _get_status_text(raw_data: Dict) -> str:
     """Get human-readable device status."""
-    device_status = raw_data.get("deviceStatus", "Unknown")
-
-    status_map = {
-        "200": "Online",
-        "203": "Offline",
-        "201": "Partial"
-    }
-
-    return status_map.get(device_status, "Unknown")
+    return _STATUS_MAP.get(raw_data.get("deviceStatus"), "Unknown")
 
 
 def _get_battery_display(raw_data: Dict) -> str:
@@ -134,24 +148,16 @@ def _format_location_info(raw_data: Dict) -> List[str]:
     lines = []
 
     # Coordinates
-    if location_data.get("latitude") and location_data.get("longitude"):
-        lines.append(f"Coordinates: {location_data['latitude']}, {location_data['longitude']}")
-
-    # Altitude
-    if location_data.get("altitude"):
-        lines.append(f"Altitude: {location_data['altitude']} meters")
-
-    # Floor level
-    if location_data.get("floorLevel"):
-        lines.append(f"Floor Level: {location_data['floorLevel']}")
+    latitude = location_data.get("latitude")
+    longitude = location_data.get("longitude")
+    if latitude and longitude:
+        lines.append(f"Coordinates: {latitude}, {longitude}")
 
-    # Accuracy
-    if location_data.get("horizontalAccuracy"):
-        lines.append(f"Accuracy: {location_data['horizontalAccuracy']} meters")
-
-    # Position type
-    if location_data.get("positionType"):
-        lines.append(f"Position Type: {location_data['positionType']}")
+    # Altitude, floor level, accuracy, position type
+    for key, template in _LOCATION_FIELDS:
+        value = location_data.get(key)
+        if value:
+            lines.append(template.format(value))
 
     # Timestamp
     if location_data.get("timeStamp"):
@@ -162,10 +168,8 @@ def _format_location_info(raw_data: Dict) -> List[str]:
             pass
 
     # Warnings
-    if location_data.get("isOld"):
-        lines.append("⚠️ Location data may be outdated")
-
-    if location_data.get("isInaccurate"):
-        lines.append("⚠️ Location may be inaccurate")
+    for key, warning in _LOCATION_WARNINGS:
+        if location_data.get(key):
+            lines.append(warning)
 
     return lines
@@ -13,26 +13,26 @@ class AuthenticationMiddleware(Middleware):
     """Middleware that ensures iCloud authentication before executing tools that require it."""
 
     # Tools that require iCloud authentication
-    ICLOUD_TOOLS = {
+    ICLOUD_TOOLS = frozenset({
         "list_devices",
         "get_device_info",
         "refresh_cache",
-    }
+    })
 
     # Tools that don't require authentication
-    NO_AUTH_TOOLS = {
+    NO_AUTH_TOOLS = frozenset({
         "clear_stored_credentials",
-    }
+    })
+
+    # Tools routed through authentication, resolved once so each call is a single lookup
+    _AUTH_REQUIRED_TOOLS = ICLOUD_TOOLS - NO_AUTH_TOOLS
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         """Intercept tool calls and ensure authentication for iCloud-dependent tools."""
         tool_name = context.message.name
         fastmcp_context = context.fastmcp_context
 
-        if tool_name in self.NO_AUTH_TOOLS:
-            return await call_next(context)
-
-        if tool_name in self.ICLOUD_TOOLS:
+        if tool_name in self._AUTH_REQUIRED_TOOLS:
             if fastmcp_context is None:
                 raise ToolError("FastMCP context unavailable for authentication")
             await self._ensure_authenticated(fastmcp_context)
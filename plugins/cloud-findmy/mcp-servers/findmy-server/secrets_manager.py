@@ -1,10 +1,24 @@
 import json
 import keyring
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
 # Note: Linux needs libsecret to use this.
 # Note2: Windows has a limit of 2560 characters for the password.
 
 
+if orjson is not None:
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 class MCPSecretsManager:
     """MCP Secrets Manager for secure keyring-based secret storage."""
@@ -21,11 +35,13 @@ class MCPSecretsManager:
     def _initalize_manager(self, server_name):
         self.server_name = server_name
         self.service_name = f"com.mcp.{self.server_name}"
+        # Deserialized secret index; None means it must be (re)loaded from keyring
+        self._index_cache = None
 
     def _serialize_secret_content(self, content):
         """Serialize secret content - use JSON prefix for complex types, direct string for simple strings"""
         if isinstance(content, (dict, list)):
-            return "JSON:" + json.dumps(content)
+            return "JSON:" + _json_dumps(content)
         else:
             # For strings and other simple types, store directly
             return str(content)
@@ -33,19 +49,19 @@ class MCPSecretsManager:
     def _deserialize_secret_content(self, serialized_content):
         """Deserialize secret content - handle JSON prefix or return as-is"""
         if serialized_content and serialized_content.startswith("JSON:"):
-            return json.loads(serialized_content[5:])
+            return _json_loads(serialized_content[5:])
         else:
             return serialized_content
 
     def _serialize_index_content(self, index_set):
         """Serialize index set as JSON list"""
-        return json.dumps(list(index_set))
+        return _json_dumps(list(index_set))
 
     def _deserialize_index_content(self, serialized_index):
         """Deserialize index from JSON list to set"""
         if serialized_index:
             try:
-                data = json.loads(serialized_index)
+                data = _json_loads(serialized_index)
                 return set(data) if isinstance(data, list) else set()
             except json.JSONDecodeError:
                 return set()
@@ -80,17 +96,43 @@ class MCPSecretsManager:
         serialized_content = keyring.get_password(self.service_name, username)
         return self._deserialize_secret_content(serialized_content)
 
+    def store_secrets(self, secrets):
+        """Store several secrets, updating the index once.
+
+        Args:
+            secrets: Mapping of secret name to content (string, dict, or list)
+        """
+        for secret_name, content in secrets.items():
+            keyring.set_password(self.service_name, secret_name, self._serialize_secret_content(content))
+        if secrets:
+            self._update_secret_index(*secrets)
+
     def delete_secret(self, secret_name):
         """Delete a secret from the keyring for this server.
 
         Args:
             secret_name: Name of the secret to delete
         """
-        username = secret_name
-        keyring.delete_password(self.service_name, username)
+        self._delete_secret_no_index(secret_name)
         # Remove from the index
         self._remove_from_secret_index(secret_name)
 
+    def delete_secrets(self, secret_names):
+        """Delete several secrets, updating the index once.
+
+        Args:
+            secret_names: Iterable of secret names to delete
+        """
+        secret_names = list(secret_names)
+        for secret_name in secret_names:
+            self._delete_secret_no_index(secret_name)
+        if secret_names:
+            self._remove_from_secret_index(*secret_names)
+
+    def _delete_secret_no_index(self, secret_name):
+        """Delete a secret's keyring entry without touching the index"""
+        keyring.delete_password(self.service_name, secret_name)
+
     def list_secrets(self):
         """List all secret names for this server.
 
@@ -108,23 +150,33 @@ class MCPSecretsManager:
         """
         self._initalize_manager(server_name)
 
+    def invalidate_index(self):
+        """Drop the cached secret index so the next access re-reads the keyring.
+
+        Call this if another process or tool may have modified this server's secrets.
+        """
+        self._index_cache = None
+
     def _get_secret_index(self):
-        """Get the index of all secrets for this server"""
-        index_username = "__secret_index__"
-        index_data = keyring.get_password(self.service_name, index_username)
-        return self._deserialize_index_content(index_data)
+        """Get a copy of the index of all secrets for this server"""
+        if self._index_cache is None:
+            index_username = "__secret_index__"
+            index_data = keyring.get_password(self.service_name, index_username)
+            self._index_cache = self._deserialize_index_content(index_data)
+        return set(self._index_cache)
 
-    def _update_secret_index(self, secret_name):
-        """Update the index to include a new secret"""
+    def _update_secret_index(self, *secret_names):
+        """Update the index to include new secrets"""
         index = self._get_secret_index()
-        index.add(secret_name)  # Add to set
+        index.update(secret_names)  # Add to set
         index_username = "__secret_index__"
         keyring.set_password(self.service_name, index_username, self._serialize_index_content(index))
+        self._index_cache = index
 
-    def _remove_from_secret_index(self, secret_name):
-        """Remove a secret from the index"""
+    def _remove_from_secret_index(self, *secret_names):
+        """Remove secrets from the index"""
         index = self._get_secret_index()
-        index.discard(secret_name)  # Remove from set (safe if not present)
+        index.difference_update(secret_names)  # Remove from set (safe if not present)
         if index:  # If there are still secrets, update the index
             index_username = "__secret_index__"
             keyring.set_password(self.service_name, index_username, self._serialize_index_content(index))
@@ -134,17 +186,19 @@ class MCPSecretsManager:
                 keyring.delete_password(self.service_name, index_username)
             except Exception:
                 pass  # Index might not exist, that's fine
+        self._index_cache = index
         
     def _delete_all_secrets(self):
         """Delete all secrets for this server"""
         index = self._get_secret_index()
         for secret_name in index:
-            self.delete_secret(secret_name)
-        # Finally, delete the index
+            self._delete_secret_no_index(secret_name)
+        # Finally, delete the index once rather than rewriting it per secret
         try:
             keyring.delete_password(self.service_name, "__secret_index__")
         except Exception:
             pass  # Index might not exist, that's fine
+        self._index_cache = set()
 
     def clear_server_secrets(self):
         """Clear all secrets for this server"""
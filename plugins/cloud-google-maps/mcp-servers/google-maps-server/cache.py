@@ -2,51 +2,149 @@
 Simple in-memory caching for Google Maps API responses.
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry with data and timestamp."""
+    """Cache entry with data, its monotonic-clock expiry time, and formatted output."""
     data: Any
-    cached_at: datetime
+    expires_at: float
+    formatted: Optional[str] = None
 
 
-# Global cache - simple dictionary implementation
-_cache: Dict[str, CacheEntry] = {}
+@dataclass(slots=True)
+class CacheCounters:
+    """Running cache counters for tuning MAX_ENTRIES and the timeout."""
+    hits: int = 0
+    misses: int = 0
+    expired_evictions: int = 0
+    lru_evictions: int = 0
+
+
+# Global cache - insertion-ordered for LRU eviction (least recently used first).
+# Keyed by a fixed-size digest of the caller's key so long address lists don't
+# sit in memory twice.
+_cache: "OrderedDict[bytes, CacheEntry]" = OrderedDict()
+# Guards every _cache access; tool calls may run concurrently
+_lock = threading.Lock()
+_counters = CacheCounters()
 CACHE_TIMEOUT_MINUTES = 10  # Cache for 10 minutes by default
+CACHE_TIMEOUT_SECONDS = CACHE_TIMEOUT_MINUTES * 60
+MAX_ENTRIES = 2048  # Evict least recently used entries beyond this size
+
+
+def make_cache_key(prefix: str, **params: Any) -> str:
+    """Build an unambiguous cache key from a request type and its parameters.
+
+    Parameters are serialised as canonical JSON, so values containing ':' or '|'
+    cannot run into a neighbouring field the way a joined f-string could.
+    """
+    return prefix + ":" + json.dumps(params, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _digest(key: str) -> bytes:
+    """Reduce a cache key to a 16-byte digest."""
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+def cache_response(key: str, data: Any, formatted: Optional[str] = None) -> None:
+    """Cache API response data, optionally with its formatted display text."""
+    key = _digest(key)
+    entry = CacheEntry(
+        data=data,
+        expires_at=time.monotonic() + CACHE_TIMEOUT_SECONDS,
+        formatted=formatted,
+    )
+    with _lock:
+        _cache[key] = entry
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+            _counters.lru_evictions += 1
 
 
-def cache_response(key: str, data: Any) -> None:
-    """Cache API response data."""
-    _cache[key] = CacheEntry(data=data, cached_at=datetime.now())
+def _get_live_entry(key: bytes, now: float) -> Optional[CacheEntry]:
+    """Return the unexpired entry for key, marking it recently used. Caller holds _lock."""
+    entry = _cache.get(key)
+    if entry is None:
+        _counters.misses += 1
+        return None
+
+    if entry.expires_at > now:
+        _cache.move_to_end(key)
+        _counters.hits += 1
+        return entry
+
+    # Remove expired cache
+    del _cache[key]
+    _counters.misses += 1
+    _counters.expired_evictions += 1
+    return None
+
+
+def get_cached_entry(key: str) -> Optional[CacheEntry]:
+    """Get the cached entry (data and formatted text) if within timeout.
+
+    Counts as one hit or miss, so callers needing both fields should use this
+    rather than get_cached_formatted followed by get_cached_response.
+    """
+    key = _digest(key)
+    now = time.monotonic()
+    with _lock:
+        return _get_live_entry(key, now)
 
 
 def get_cached_response(key: str) -> Optional[Any]:
     """Get cached response if within timeout."""
-    if key in _cache:
-        entry = _cache[key]
-        cutoff_time = datetime.now() - timedelta(minutes=CACHE_TIMEOUT_MINUTES)
+    key = _digest(key)
+    now = time.monotonic()
+    with _lock:
+        entry = _get_live_entry(key, now)
+        return entry.data if entry is not None else None
 
-        if entry.cached_at > cutoff_time:
-            return entry.data
-        else:
-            # Remove expired cache
-            del _cache[key]
 
-    return None
+def cache_formatted(key: str, text: str) -> None:
+    """Attach formatted display text to an existing cache entry."""
+    key = _digest(key)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            entry.formatted = text
+
+
+def get_cached_formatted(key: str) -> Optional[str]:
+    """Get cached formatted display text if within timeout."""
+    key = _digest(key)
+    now = time.monotonic()
+    with _lock:
+        entry = _get_live_entry(key, now)
+        return entry.formatted if entry is not None else None
 
 
 def clear_cache() -> None:
-    """Clear all cached data."""
-    _cache.clear()
+    """Clear all cached data and reset counters."""
+    global _counters
+    with _lock:
+        _cache.clear()
+        _counters = CacheCounters()
 
 
 def get_cache_stats() -> Dict[str, int]:
     """Get cache statistics."""
-    return {
-        "total_entries": len(_cache),
-        "cache_timeout_minutes": CACHE_TIMEOUT_MINUTES
-    }
+    with _lock:
+        return {
+            "total_entries": len(_cache),
+            "max_entries": MAX_ENTRIES,
+            "cache_timeout_minutes": CACHE_TIMEOUT_MINUTES,
+            "hits": _counters.hits,
+            "misses": _counters.misses,
+            "expired_evictions": _counters.expired_evictions,
+            "lru_evictions": _counters.lru_evictions,
+        }
@@ -2,114 +2,143 @@
 Format Google Maps API responses for human-readable output.
 """
 
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any, Optional
 import json
+import re
+
+
+# Markup in Directions API html_instructions, rewritten in one regex pass
+_HTML_TAG_REPLACEMENTS = {
+    '<b>': '**',
+    '</b>': '**',
+    '<div>': '\n',
+    '</div>': '',
+}
+_HTML_TAG_PATTERN = re.compile('|'.join(map(re.escape, _HTML_TAG_REPLACEMENTS)))
+
+
+# Constant headers, including their trailing blank line where one always follows
+_GEOCODE_HEADER = "📍 **Geocoding Result**\n\n"
+_REVERSE_GEOCODE_HEADER = "📍 **Reverse Geocoding Result**\n\n"
+_DISTANCE_MATRIX_HEADER = "🗺️ **Distance Matrix Results**\n\n"
+_DIRECTIONS_HEADER = "🛣️ **Directions**\n\n"
+_HOURS_HEADER = "\n\n**Hours:**"
+_REVIEWS_HEADER = "\n\n**Recent Reviews:**"
+_STEPS_HEADER = "**Directions:**"
+
+# Complete outputs for empty results
+_NO_PLACES = "🔍 **No places found**"
+_NO_ELEVATION = "🏔️ **No elevation data found**"
+_NO_ROUTES = "🛣️ **No routes found**"
+
+
+def _replace_html_tag(match: "re.Match[str]") -> str:
+    return _HTML_TAG_REPLACEMENTS[match.group(0)]
+
+
+def _text_of(data: Dict[str, Any], key: str, default: str = 'N/A') -> str:
+    """Return data[key]['text'] without allocating fallback dicts for missing values."""
+    value = data.get(key)
+    return value.get('text', default) if isinstance(value, dict) else default
+
+
+@lru_cache(maxsize=4096)
+def _clean_html(html: str) -> str:
+    """Convert direction step markup to Markdown; memoized since routes repeat step text."""
+    return _HTML_TAG_PATTERN.sub(_replace_html_tag, html)
 
 
 def format_geocode_result(result: Dict[str, Any]) -> str:
     """Format geocoding result for display."""
-    lines = [
-        "📍 **Geocoding Result**",
-        "",
-        f"**Address:** {result.get('formatted_address', 'N/A')}",
-        f"**Place ID:** {result.get('place_id', 'N/A')}",
-        f"**Coordinates:** {result.get('location', {}).get('lat', 'N/A')}, {result.get('location', {}).get('lng', 'N/A')}",
-    ]
-    return "\n".join(lines)
+    location = result.get('location') or {}
+    return (
+        f"{_GEOCODE_HEADER}"
+        f"**Address:** {result.get('formatted_address', 'N/A')}\n"
+        f"**Place ID:** {result.get('place_id', 'N/A')}\n"
+        f"**Coordinates:** {location.get('lat', 'N/A')}, {location.get('lng', 'N/A')}"
+    )
 
 
 def format_reverse_geocode_result(result: Dict[str, Any]) -> str:
     """Format reverse geocoding result for display."""
-    lines = [
-        "📍 **Reverse Geocoding Result**",
-        "",
-        f"**Address:** {result.get('formatted_address', 'N/A')}",
-        f"**Place ID:** {result.get('place_id', 'N/A')}",
-    ]
+    # Index address components by type in one pass; reversed so the first component of each type wins
+    components = result.get('address_components') or ()
+    by_type = {t: comp for comp in reversed(components) for t in comp.get('types', ())}
+    county = (by_type.get('administrative_area_level_2') or {}).get('long_name', '')
 
-    # Extract county from address components
-    components = result.get('address_components', [])
-    county = None
-    for comp in components:
-        if 'administrative_area_level_2' in comp.get('types', []):
-            county = comp.get('long_name', '')
-            break
+    county_line = f"\n**County:** {county}" if county else ""
 
-    if county:
-        lines.append(f"**County:** {county}")
-
-    return "\n".join(lines)
+    return (
+        f"{_REVERSE_GEOCODE_HEADER}"
+        f"**Address:** {result.get('formatted_address', 'N/A')}\n"
+        f"**Place ID:** {result.get('place_id', 'N/A')}"
+        f"{county_line}"
+    )
 
 
 def format_place_search_results(results: List[Dict[str, Any]]) -> str:
     """Format place search results for display."""
     if not results:
-        return "🔍 **No places found**"
+        return _NO_PLACES
 
-    lines = [
-        f"🔍 **Found {len(results)} places**",
-        ""
-    ]
+    lines = [f"🔍 **Found {len(results)} places**"]
 
+    # One list element per place keeps the list at len(results) + 2 entries
     for i, place in enumerate(results, 1):
-        lines.extend([
-            f"**{i}. {place.get('name', 'Unknown Place')}**",
-            f"   📍 {place.get('formatted_address', 'No address')}",
-            f"   🆔 {place.get('place_id', 'No ID')}",
-        ])
-
-        if place.get('rating'):
-            lines.append(f"   ⭐ {place['rating']} stars")
-        if place.get('types'):
-            lines.append(f"   🏷️  {', '.join(place['types'][:3])}")  # Show first 3 types
-
-        lines.append("")
-
+        rating = place.get('rating')
+        types = place.get('types')
+        rating_line = f"\n   ⭐ {rating} stars" if rating else ""
+        types_line = f"\n   🏷️  {', '.join(islice(types, 3))}" if types else ""  # Show first 3 types
+
+        # Leading newline supplies the blank line before each place
+        lines.append(
+            f"\n**{i}. {place.get('name', 'Unknown Place')}**\n"
+            f"   📍 {place.get('formatted_address', 'No address')}\n"
+            f"   🆔 {place.get('place_id', 'No ID')}"
+            f"{rating_line}{types_line}"
+        )
+
+    # Trailing blank line after the last place
+    lines.append("")
     return "\n".join(lines)
 
 
 def format_place_details(result: Dict[str, Any]) -> str:
     """Format place details for display."""
-    lines = [
-        f"🏢 **{result.get('name', 'Unknown Place')}**",
-        "",
-        f"📍 **Address:** {result.get('formatted_address', 'N/A')}",
-    ]
-
-    if result.get('formatted_phone_number'):
-        lines.append(f"📞 **Phone:** {result['formatted_phone_number']}")
-
-    if result.get('website'):
-        lines.append(f"🌐 **Website:** {result['website']}")
-
-    if result.get('rating'):
-        lines.append(f"⭐ **Rating:** {result['rating']} stars")
-
-    if result.get('opening_hours'):
-        hours = result['opening_hours']
-        lines.append(f"🕒 **Open now:** {'Yes' if hours.get('open_now') else 'No'}")
+    phone = result.get('formatted_phone_number')
+    website = result.get('website')
+    rating = result.get('rating')
+    phone_line = f"\n📞 **Phone:** {phone}" if phone else ""
+    website_line = f"\n🌐 **Website:** {website}" if website else ""
+    rating_line = f"\n⭐ **Rating:** {rating} stars" if rating else ""
+
+    hours_block = ""
+    hours = result.get('opening_hours')
+    if hours:
+        hours_block = f"\n🕒 **Open now:** {'Yes' if hours.get('open_now') else 'No'}"
 
         if hours.get('weekday_text'):
-            lines.append("")
-            lines.append("**Hours:**")
-            for day in hours['weekday_text'][:7]:  # Show all days
-                lines.append(f"• {day}")
+            hours_block += _HOURS_HEADER + "".join(
+                f"\n• {day}" for day in islice(hours['weekday_text'], 7)  # Show all days
+            )
 
+    reviews_block = ""
     if result.get('reviews'):
-        reviews = result['reviews'][:3]  # Show first 3 reviews
-        lines.append("")
-        lines.append("**Recent Reviews:**")
-        for review in reviews:
-            author = review.get('author_name', 'Anonymous')
-            rating = review.get('rating', 'N/A')
-            text = review.get('text', '')[:200]  # Truncate long reviews
-            lines.extend([
-                f"• **{author}** ({rating}⭐)",
-                f"  {text}...",
-                ""
-            ])
+        # Show first 3 reviews, truncating long review text
+        reviews_block = _REVIEWS_HEADER + "".join(
+            f"\n• **{review.get('author_name', 'Anonymous')}** ({review.get('rating', 'N/A')}⭐)\n"
+            f"  {review.get('text', '')[:200]}...\n"
+            for review in islice(result['reviews'], 3)
+        )
 
-    return "\n".join(lines)
+    return (
+        f"🏢 **{result.get('name', 'Unknown Place')}**\n"
+        "\n"
+        f"📍 **Address:** {result.get('formatted_address', 'N/A')}"
+        f"{phone_line}{website_line}{rating_line}{hours_block}{reviews_block}"
+    )
 
 
 def format_distance_matrix(results: Dict[str, Any]) -> str:
@@ -119,34 +148,32 @@ def format_distance_matrix(results: Dict[str, Any]) -> str:
     rows = results.get('rows', [])
 
     lines = [
-        "🗺️ **Distance Matrix Results**",
-        "",
-        f"**From:** {len(origins)} origins",
-        f"**To:** {len(destinations)} destinations",
-        ""
+        f"{_DISTANCE_MATRIX_HEADER}"
+        f"**From:** {len(origins)} origins\n"
+        f"**To:** {len(destinations)} destinations\n"
     ]
 
-    for i, row in enumerate(rows):
-        origin = origins[i] if i < len(origins) else f"Origin {i+1}"
-
-        for j, element in enumerate(row.get('elements', [])):
-            dest = destinations[j] if j < len(destinations) else f"Destination {j+1}"
+    # Malformed responses may have more rows/elements than addresses; pad labels once up front
+    if len(origins) < len(rows):
+        origins = [*origins, *(f"Origin {i+1}" for i in range(len(origins), len(rows)))]
+    max_elements = max((len(row.get('elements', ())) for row in rows), default=0)
+    if len(destinations) < max_elements:
+        destinations = [*destinations, *(f"Destination {j+1}" for j in range(len(destinations), max_elements))]
 
+    for row, origin in zip(rows, origins):
+        for element, dest in zip(row.get('elements', ()), destinations):
+            # One list element per origin/destination pair
             if element.get('status') == 'OK':
-                distance = element.get('distance', {}).get('text', 'N/A')
-                duration = element.get('duration', {}).get('text', 'N/A')
-                lines.extend([
-                    f"**{origin} → {dest}**",
-                    f"   📏 Distance: {distance}",
-                    f"   ⏱️  Duration: {duration}",
-                    ""
-                ])
+                lines.append(
+                    f"**{origin} → {dest}**\n"
+                    f"   📏 Distance: {_text_of(element, 'distance')}\n"
+                    f"   ⏱️  Duration: {_text_of(element, 'duration')}\n"
+                )
             else:
-                lines.extend([
-                    f"**{origin} → {dest}**",
-                    f"   ❌ Status: {element.get('status', 'Unknown')}",
-                    ""
-                ])
+                lines.append(
+                    f"**{origin} → {dest}**\n"
+                    f"   ❌ Status: {element.get('status', 'Unknown')}\n"
+                )
 
     return "\n".join(lines)
 
@@ -154,25 +181,22 @@ def format_distance_matrix(results: Dict[str, Any]) -> str:
 def format_elevation_results(results: List[Dict[str, Any]]) -> str:
     """Format elevation results for display."""
     if not results:
-        return "🏔️ **No elevation data found**"
+        return _NO_ELEVATION
 
-    lines = [
-        f"🏔️ **Elevation Data for {len(results)} locations**",
-        ""
-    ]
+    lines = [f"🏔️ **Elevation Data for {len(results)} locations**\n"]
 
     for i, result in enumerate(results, 1):
-        lat = result.get('location', {}).get('lat', 'N/A')
-        lng = result.get('location', {}).get('lng', 'N/A')
+        location = result.get('location') or {}
+        lat = location.get('lat', 'N/A')
+        lng = location.get('lng', 'N/A')
         elevation = result.get('elevation', 'N/A')
         resolution = result.get('resolution', 'N/A')
 
-        lines.extend([
+        lines.extend((
             f"**Location {i}:** {lat}, {lng}",
             f"   ⛰️  Elevation: {elevation}m",
-            f"   🎯 Resolution: {resolution}m",
-            ""
-        ])
+            f"   🎯 Resolution: {resolution}m\n",
+        ))
 
     return "\n".join(lines)
 
@@ -182,38 +206,33 @@ def format_directions_result(result: Dict[str, Any]) -> str:
     routes = result.get('routes', [])
 
     if not routes:
-        return "🛣️ **No routes found**"
+        return _NO_ROUTES
 
     route = routes[0]  # Take the first/best route
+
+    # Header with route summary, total distance and duration
+    distance = _text_of(route, 'distance')
+    duration = _text_of(route, 'duration')
     lines = [
-        "🛣️ **Directions**",
-        "",
-        f"**Route Summary:** {route.get('summary', 'N/A')}",
+        f"{_DIRECTIONS_HEADER}"
+        f"**Route Summary:** {route.get('summary', 'N/A')}\n"
+        f"**Total Distance:** {distance}\n"
+        f"**Total Duration:** {duration}\n"
     ]
 
-    # Add total distance and duration
-    distance = route.get('distance', {}).get('text', 'N/A')
-    duration = route.get('duration', {}).get('text', 'N/A')
-    lines.extend([
-        f"**Total Distance:** {distance}",
-        f"**Total Duration:** {duration}",
-        ""
-    ])
-
     # Add turn-by-turn directions
     steps = route.get('steps', [])
     if steps:
-        lines.append("**Directions:**")
+        lines.append(_STEPS_HEADER)
         for i, step in enumerate(steps, 1):
-            instructions = step.get('html_instructions', '').replace('<b>', '**').replace('</b>', '**').replace('<div>', '\n').replace('</div>', '')
-            distance_step = step.get('distance', {}).get('text', 'N/A')
-            duration_step = step.get('duration', {}).get('text', 'N/A')
+            instructions = _clean_html(step.get('html_instructions', ''))
+            distance_step = _text_of(step, 'distance')
+            duration_step = _text_of(step, 'duration')
 
-            lines.extend([
+            lines.extend((
                 f"{i}. {instructions}",
-                f"   📏 {distance_step} • ⏱️ {duration_step}",
-                ""
-            ])
+                f"   📏 {distance_step} • ⏱️ {duration_step}\n",
+            ))
 
     return "\n".join(lines)
 
@@ -4,21 +4,96 @@ Reusable Google Maps API client helpers.
 This module isolates HTTP/API interaction from MCP tool wrappers.
 """
 
-from typing import Any, Dict
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+# Parse the raw body directly; orjson also skips decoding it to str first
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+BASE_URL = "https://maps.googleapis.com/maps/api/"
+
+# Shared connection pool so repeat calls reuse the TLS connection to maps.googleapis.com
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=75,
+)
+
+# Upper bound on sub-requests in flight for one batched call, to stay clear of rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+_client: Optional[httpx.AsyncClient] = None
+# Requests currently on the wire, so identical concurrent calls share one response
+_inflight: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], "asyncio.Task[Dict[str, Any]]"] = {}
+
 
 class GoogleMapsApiError(Exception):
     """Raised when a Google Maps API call does not return OK status."""
 
 
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Creation has no await point, so concurrent tool calls on the event loop
+    cannot race to build two clients.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(base_url=BASE_URL, limits=_CLIENT_LIMITS)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def _fetch_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    client = await get_client()
+    response = await client.get(endpoint, params=params)
+    return _json_loads(response.content)
+
+
 async def get_json(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    """Call a Google Maps endpoint and return parsed JSON data."""
-    url = f"https://maps.googleapis.com/maps/api/{endpoint}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params)
-        return response.json()
+    """Call a Google Maps endpoint and return parsed JSON data.
+
+    Concurrent calls with the same endpoint and params wait on a single
+    request instead of each spending API quota on it.
+    """
+    key = (endpoint, tuple(sorted(params.items())))
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(endpoint, params))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+async def get_json_many(endpoint: str, params_list: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Call one endpoint concurrently for each params dict, returning results in order."""
+    if len(params_list) == 1:
+        return [await get_json(endpoint, params_list[0])]
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_json(endpoint, params)
+
+    return list(await asyncio.gather(*(fetch(params) for params in params_list)))
 
 
 def require_ok_status(data: Dict[str, Any], prefix: str) -> None:
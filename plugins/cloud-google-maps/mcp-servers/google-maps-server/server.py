@@ -5,17 +5,15 @@ Thin entrypoint delegating to modular app package per design guidelines.
 """
 
 import os
-from fastmcp import FastMCP
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-from tools_maps import register as register_maps
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
-from secrets_manager import secrets_manager
 
-"""Create FastMCP server with clear instructions."""
-mcp = FastMCP(
-    name="google-maps-server",
-    instructions=(
-        """
+_INSTRUCTIONS = """
         Provides access to Google Maps APIs for location services.
         Use maps_geocode to convert addresses to coordinates, maps_reverse_geocode for coordinates to addresses.
         Use maps_search_places for finding places by text query, maps_place_details for detailed place information.
@@ -23,19 +21,57 @@ mcp = FastMCP(
         Results are cached for 10 minutes by default to minimize API calls and improve performance.
         Requires GOOGLE_MAPS_API_KEY environment variable to be set.
         """
-    ),
-)
 
 
-# Lightweight initialization: configures keyring namespace only.
-secrets_manager.initialize(mcp.name)
+@asynccontextmanager
+async def _lifespan(_server: "FastMCP") -> AsyncIterator[Any]:
+    """Close the shared Google Maps HTTP client when the server shuts down."""
+    from google_maps_client import close_client
+
+    try:
+        yield {}
+    finally:
+        await close_client()
+
+
+@lru_cache(maxsize=None)
+def create_server() -> "FastMCP":
+    """Create FastMCP server with clear instructions.
+
+    FastMCP, the tool modules, and the keyring-backed secrets manager are
+    imported here rather than at module load, so importing this module
+    stays cheap until the server is actually needed.
+    """
+    from fastmcp import FastMCP
+
+    from tools_maps import register as register_maps
+
+    from secrets_manager import secrets_manager
+
+    mcp = FastMCP(
+        name="google-maps-server",
+        instructions=_INSTRUCTIONS,
+        lifespan=_lifespan,
+    )
+
+    # Lightweight initialization: configures keyring namespace only.
+    secrets_manager.initialize(mcp.name)
+
+    # Register Tools
+    register_maps(mcp)
+    return mcp
+
 
-# Register Tools
-register_maps(mcp)
+def __getattr__(name: str):
+    # Keep `from server import mcp` and `fastmcp run server.py` working without eager imports
+    if name == "mcp":
+        return create_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Run server supporting both stdio and HTTP transports."""
+    mcp = create_server()
     mcp_host = os.getenv("HOST", "127.0.0.1")
     mcp_port = os.getenv("PORT", None)
     if mcp_port:
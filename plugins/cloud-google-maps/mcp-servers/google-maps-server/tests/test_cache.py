@@ -0,0 +1,133 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+import cache
+from cache import (
+    cache_formatted,
+    cache_response,
+    clear_cache,
+    get_cache_stats,
+    get_cached_entry,
+    get_cached_formatted,
+    get_cached_response,
+    make_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_cache_round_trip():
+    cache_response("geocode:hello", {"place_id": "abc"})
+    assert get_cached_response("geocode:hello") == {"place_id": "abc"}
+    assert get_cached_response("geocode:missing") is None
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 2)
+    cache_response("a", 1)
+    cache_response("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry
+    assert get_cached_response("a") == 1
+    cache_response("c", 3)
+
+    assert get_cached_response("b") is None
+    assert get_cached_response("a") == 1
+    assert get_cached_response("c") == 3
+    assert get_cache_stats()["total_entries"] == 2
+
+
+def test_cache_entry_expires_after_timeout(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    cache_response("a", 1)
+
+    now[0] += cache.CACHE_TIMEOUT_SECONDS - 1
+    assert get_cached_response("a") == 1
+
+    now[0] += 1
+    assert get_cached_response("a") is None
+    assert get_cache_stats()["total_entries"] == 0
+
+
+def test_formatted_text_is_cached_alongside_data():
+    cache_response("a", {"x": 1}, formatted="text")
+    assert get_cached_formatted("a") == "text"
+
+    cache_response("b", {"x": 2})
+    assert get_cached_formatted("b") is None
+    cache_formatted("b", "later")
+    assert get_cached_formatted("b") == "later"
+    assert get_cached_response("b") == {"x": 2}
+
+
+def test_cache_formatted_ignores_missing_key():
+    cache_formatted("missing", "text")
+    assert get_cached_formatted("missing") is None
+
+
+def test_cache_stats_report_size_limits():
+    cache_response("a", 1)
+    stats = get_cache_stats()
+    assert stats["total_entries"] == 1
+    assert stats["max_entries"] == cache.MAX_ENTRIES
+    assert stats["cache_timeout_minutes"] == cache.CACHE_TIMEOUT_MINUTES
+
+
+def test_cache_stats_count_hits_misses_and_evictions(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 1)
+
+    cache_response("a", 1)
+    assert get_cached_response("a") == 1
+    assert get_cached_response("missing") is None
+    cache_response("b", 2)  # evicts "a"
+    now[0] += cache.CACHE_TIMEOUT_SECONDS
+    assert get_cached_response("b") is None  # expired
+
+    stats = get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["lru_evictions"] == 1
+    assert stats["expired_evictions"] == 1
+
+
+def test_cached_entry_counts_one_lookup():
+    cache_response("a", {"x": 1}, formatted="text")
+    cache_response("b", {"x": 2})
+
+    entry = get_cached_entry("a")
+    assert (entry.data, entry.formatted) == ({"x": 1}, "text")
+    assert get_cached_entry("b").formatted is None
+    assert get_cached_entry("missing") is None
+
+    stats = get_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_cache_stores_fixed_size_keys():
+    long_key = "distance_matrix:" + "|".join(["Some Very Long Street Address"] * 200)
+    cache_response(long_key, {"rows": []})
+
+    assert get_cached_response(long_key) == {"rows": []}
+    assert get_cached_response(long_key + "x") is None
+    assert all(len(key) == 16 for key in cache._cache)
+
+
+def test_make_cache_key_is_canonical_and_unambiguous():
+    assert make_cache_key("directions", origin="a", destination="b") == make_cache_key(
+        "directions", destination="b", origin="a"
+    )
+    # Separators inside values must not shift field boundaries
+    assert make_cache_key("directions", origin="a:b", destination="c") != make_cache_key(
+        "directions", origin="a", destination="b:c"
+    )
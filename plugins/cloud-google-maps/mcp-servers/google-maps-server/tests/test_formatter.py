@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from formatter import format_distance_matrix, format_geocode_result, format_reverse_geocode_result
+
+
+def test_format_geocode_result():
+    text = format_geocode_result({
+        "formatted_address": "Test Address",
+        "place_id": "abc123",
+        "location": {"lat": 1.23, "lng": 4.56},
+    })
+    assert text == (
+        "📍 **Geocoding Result**\n"
+        "\n"
+        "**Address:** Test Address\n"
+        "**Place ID:** abc123\n"
+        "**Coordinates:** 1.23, 4.56"
+    )
+
+
+def test_format_geocode_result_missing_fields():
+    assert format_geocode_result({}).endswith("**Coordinates:** N/A, N/A")
+
+
+def test_format_reverse_geocode_result_includes_county():
+    text = format_reverse_geocode_result({
+        "formatted_address": "Test Address",
+        "place_id": "abc123",
+        "address_components": [
+            {"long_name": "Springfield", "types": ["locality", "political"]},
+            {"long_name": "Greene County", "types": ["administrative_area_level_2", "political"]},
+        ],
+    })
+    assert text.endswith("**Place ID:** abc123\n**County:** Greene County")
+
+
+def test_format_reverse_geocode_result_without_county():
+    text = format_reverse_geocode_result({"formatted_address": "Test Address", "place_id": "abc123"})
+    assert text.endswith("**Place ID:** abc123")
+
+
+def test_format_distance_matrix_pairs_rows_with_addresses():
+    text = format_distance_matrix({
+        "origin_addresses": ["A"],
+        "destination_addresses": ["B"],
+        "rows": [
+            {"elements": [
+                {"status": "OK", "distance": {"text": "1 km"}, "duration": {"text": "2 mins"}},
+                {"status": "NOT_FOUND"},
+            ]},
+            {"elements": [{"status": "ZERO_RESULTS"}]},
+        ],
+    })
+    assert "**A → B**\n   📏 Distance: 1 km\n   ⏱️  Duration: 2 mins\n" in text
+    # Rows and elements beyond the address lists fall back to positional labels
+    assert "**A → Destination 2**\n   ❌ Status: NOT_FOUND\n" in text
+    assert "**Origin 2 → B**\n   ❌ Status: ZERO_RESULTS\n" in text
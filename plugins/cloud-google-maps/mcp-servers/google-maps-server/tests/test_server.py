@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, Mock, patch
 from pathlib import Path
 import sys
@@ -7,6 +8,7 @@ from fastmcp.client import Client
 from fastmcp.client.elicitation import ElicitResult
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+import google_maps_client
 from cache import clear_cache
 from server import mcp
 
@@ -16,6 +18,13 @@ def reset_cache():
     clear_cache()
 
 
+@pytest.fixture(autouse=True)
+async def reset_http_client():
+    # The shared client is bound to the event loop that created it
+    yield
+    await google_maps_client.close_client()
+
+
 @pytest.fixture
 async def client_accepting():
     async def accept_all(_message, response_type, _params, _context):
@@ -58,9 +67,11 @@ async def test_maps_geocode_success(client_accepting):
     }
 
     with patch("google_maps_client.httpx.AsyncClient") as mock_client:
-        instance = mock_client.return_value.__aenter__.return_value
+        instance = mock_client.return_value
+        instance.is_closed = False
+        instance.aclose = AsyncMock()
         mock_response = Mock()
-        mock_response.json.return_value = fake_json
+        mock_response.content = json.dumps(fake_json).encode()
         instance.get = AsyncMock(return_value=mock_response)
 
         result = await client_accepting.call_tool("maps_geocode", {"address": "hello"})
@@ -2,15 +2,22 @@
 Google Maps API tools.
 """
 
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import httpx
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import CurrentContext
 from fastmcp.tools.tool import ToolResult
 
-from cache import cache_response, get_cached_response
+from cache import (
+    cache_formatted,
+    cache_response,
+    get_cached_entry,
+    make_cache_key,
+)
 from credentials import get_api_key, get_api_key_from_user
-from google_maps_client import GoogleMapsApiError, get_json, require_ok_status
+from google_maps_client import GoogleMapsApiError, get_json, get_json_many, require_ok_status
 from formatter import (
     format_geocode_result,
     format_reverse_geocode_result,
@@ -24,7 +31,22 @@ from formatter import (
 from utils import text_response
 
 
-VALID_TRAVEL_MODES = {"driving", "walking", "bicycling", "transit"}
+VALID_TRAVEL_MODES = frozenset({"driving", "walking", "bicycling", "transit"})
+_ALLOWED_MODES_TEXT = ", ".join(sorted(VALID_TRAVEL_MODES))
+
+# Failures reported back to the caller as text; anything else is a bug and is
+# left for FastMCP to surface as a tool error
+EXPECTED_TOOL_ERRORS = (GoogleMapsApiError, ValueError, httpx.HTTPError)
+
+# Per-request limits enforced by the Distance Matrix and Elevation APIs
+MAX_MATRIX_ELEMENTS = 100
+MAX_MATRIX_SIDE = 25
+MAX_ELEVATION_LOCATIONS = 512
+
+# Decimal places coordinates are rounded to in cache keys, so GPS jitter still
+# hits the cache: 5 places is about 1 m, 4 places about 11 m
+REVERSE_GEOCODE_KEY_PRECISION = 5
+ELEVATION_KEY_PRECISION = 4
 
 
 def validate_latitude_longitude(latitude: float, longitude: float) -> None:
@@ -34,11 +56,11 @@ def validate_latitude_longitude(latitude: float, longitude: float) -> None:
         raise ValueError("longitude must be between -180 and 180")
 
 
+@lru_cache(maxsize=16)
 def validate_mode(mode: str) -> str:
     normalized_mode = mode.lower().strip()
     if normalized_mode not in VALID_TRAVEL_MODES:
-        allowed = ", ".join(sorted(VALID_TRAVEL_MODES))
-        raise ValueError(f"mode must be one of: {allowed}")
+        raise ValueError(f"mode must be one of: {_ALLOWED_MODES_TEXT}")
     return normalized_mode
 
 
@@ -56,6 +78,67 @@ def validate_locations(locations: List[Dict[str, float]]) -> None:
         validate_latitude_longitude(loc["latitude"], loc["longitude"])
 
 
+def chunked(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    """Split a sequence into consecutive slices of at most ``size`` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def plan_matrix_chunks(
+    origins: List[str], destinations: List[str]
+) -> Tuple[List[Sequence[str]], List[Sequence[str]]]:
+    """Split origins and destinations so every sub-request stays within API limits."""
+    destination_chunks = chunked(destinations, MAX_MATRIX_SIDE)
+    origins_per_request = max(1, min(MAX_MATRIX_SIDE, MAX_MATRIX_ELEMENTS // len(destination_chunks[0])))
+    return chunked(origins, origins_per_request), destination_chunks
+
+
+def merge_matrix_responses(responses: List[Dict[str, Any]], destination_chunk_count: int) -> Dict[str, Any]:
+    """Stitch sub-matrix responses, ordered origin chunk major, back into one matrix."""
+    origin_addresses: List[str] = []
+    destination_addresses: List[str] = []
+    rows: List[Dict[str, Any]] = []
+    for start in range(0, len(responses), destination_chunk_count):
+        group = responses[start:start + destination_chunk_count]
+        origin_addresses.extend(group[0].get("origin_addresses", []))
+        if start == 0:
+            for data in group:
+                destination_addresses.extend(data.get("destination_addresses", []))
+        for row_parts in zip(*(data.get("rows", []) for data in group)):
+            elements = []
+            for row in row_parts:
+                elements.extend(row.get("elements", []))
+            rows.append({"elements": elements})
+
+    return {
+        "origin_addresses": origin_addresses,
+        "destination_addresses": destination_addresses,
+        "rows": rows
+    }
+
+
+def get_cached_text(cache_key: str, formatter: Callable[[Any], str]) -> Optional[str]:
+    """Return formatted text for a cached response, formatting and storing it on first use."""
+    entry = get_cached_entry(cache_key)
+    if entry is None:
+        return None
+    if entry.formatted is not None:
+        return entry.formatted
+    if not entry.data:
+        return None
+
+    text = formatter(entry.data)
+    cache_formatted(cache_key, text)
+    return text
+
+
+def error_response(error: Exception, action: str) -> ToolResult:
+    """Format an expected tool failure as a text response."""
+    if isinstance(error, GoogleMapsApiError):
+        # API errors already carry a prefix naming the failed request
+        return text_response(format_error_message(str(error)))
+    return text_response(format_error_message(f"Error {action}: {error}"))
+
+
 async def get_or_elicit_api_key(ctx: Context) -> str:
     """
     Get API key from storage or elicit from user if not available.
@@ -113,11 +196,11 @@ def register(mcp: FastMCP) -> None:
         await ctx.info(f"Geocoding address: {address}")
 
         # Check cache first
-        cache_key = f"geocode:{address}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key("geocode", address=address)
+        cached_text = get_cached_text(cache_key, format_geocode_result)
+        if cached_text is not None:
             await ctx.info("Retrieved result from cache")
-            return text_response(format_geocode_result(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
@@ -131,16 +214,15 @@ def register(mcp: FastMCP) -> None:
                 "place_id": data["results"][0]["place_id"]
             }
 
-            # Cache the result
-            cache_response(cache_key, result)
+            text = format_geocode_result(result)
+            # Cache the result along with the formatted text
+            cache_response(cache_key, result, formatted=text)
 
             await ctx.info("Successfully geocoded address")
-            return text_response(format_geocode_result(result))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error geocoding address: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "geocoding address")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -159,16 +241,21 @@ def register(mcp: FastMCP) -> None:
 
         Returns:
             Formatted result with address, place ID, and address components.
+            Cached results are shared by coordinates within about 1 m of each other.
         """
         await ctx.info(f"Reverse geocoding coordinates: {latitude}, {longitude}")
         validate_latitude_longitude(latitude, longitude)
 
         # Check cache first
-        cache_key = f"reverse_geocode:{latitude},{longitude}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key(
+            "reverse_geocode",
+            latitude=round(latitude, REVERSE_GEOCODE_KEY_PRECISION),
+            longitude=round(longitude, REVERSE_GEOCODE_KEY_PRECISION),
+        )
+        cached_text = get_cached_text(cache_key, format_reverse_geocode_result)
+        if cached_text is not None:
             await ctx.info("Retrieved result from cache")
-            return text_response(format_reverse_geocode_result(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
@@ -185,16 +272,15 @@ def register(mcp: FastMCP) -> None:
                 "address_components": data["results"][0]["address_components"]
             }
 
-            # Cache the result
-            cache_response(cache_key, result)
+            text = format_reverse_geocode_result(result)
+            # Cache the result along with the formatted text
+            cache_response(cache_key, result, formatted=text)
 
             await ctx.info("Successfully reverse geocoded coordinates")
-            return text_response(format_reverse_geocode_result(result))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error reverse geocoding: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "reverse geocoding")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -229,12 +315,16 @@ def register(mcp: FastMCP) -> None:
             validate_radius(radius)
 
         # Build cache key
-        location_str = f"{latitude},{longitude}" if latitude and longitude else "none"
-        cache_key = f"places_search:{query}:{location_str}:{radius or 'none'}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key(
+            "places_search",
+            query=query,
+            location=f"{latitude},{longitude}" if latitude and longitude else None,
+            radius=radius or None,
+        )
+        cached_text = get_cached_text(cache_key, format_place_search_results)
+        if cached_text is not None:
             await ctx.info("Retrieved places from cache")
-            return text_response(format_place_search_results(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
@@ -265,16 +355,15 @@ def register(mcp: FastMCP) -> None:
                 }
                 results.append(place_data)
 
-            # Cache the results
-            cache_response(cache_key, results)
+            text = format_place_search_results(results)
+            # Cache the results along with the formatted text
+            cache_response(cache_key, results, formatted=text)
 
             await ctx.info(f"Found {len(results)} places")
-            return text_response(format_place_search_results(results))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error searching places: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "searching places")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -295,11 +384,11 @@ def register(mcp: FastMCP) -> None:
         await ctx.info(f"Getting details for place ID: {place_id}")
 
         # Check cache first
-        cache_key = f"place_details:{place_id}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key("place_details", place_id=place_id)
+        cached_text = get_cached_text(cache_key, format_place_details)
+        if cached_text is not None:
             await ctx.info("Retrieved place details from cache")
-            return text_response(format_place_details(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
@@ -319,16 +408,15 @@ def register(mcp: FastMCP) -> None:
                 "opening_hours": result.get("opening_hours")
             }
 
-            # Cache the result
-            cache_response(cache_key, formatted_result)
+            text = format_place_details(formatted_result)
+            # Cache the result along with the formatted text
+            cache_response(cache_key, formatted_result, formatted=text)
 
             await ctx.info("Successfully retrieved place details")
-            return text_response(format_place_details(formatted_result))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error getting place details: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "getting place details")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -358,44 +446,46 @@ def register(mcp: FastMCP) -> None:
         mode = validate_mode(mode)
 
         # Build cache key
-        origins_str = "|".join(origins)
-        destinations_str = "|".join(destinations)
-        cache_key = f"distance_matrix:{origins_str}:{destinations_str}:{mode}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key("distance_matrix", origins=origins, destinations=destinations, mode=mode)
+        cached_text = get_cached_text(cache_key, format_distance_matrix)
+        if cached_text is not None:
             await ctx.info("Retrieved distance matrix from cache")
-            return text_response(format_distance_matrix(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
             api_key = await get_or_elicit_api_key(ctx)
-            data = await get_json(
+            origin_chunks, destination_chunks = plan_matrix_chunks(origins, destinations)
+            # Join each chunk once; every chunk is paired with all chunks on the other side
+            joined_origins = ["|".join(chunk) for chunk in origin_chunks]
+            joined_destinations = ["|".join(chunk) for chunk in destination_chunks]
+            responses = await get_json_many(
                 "distancematrix/json",
-                {
-                    "origins": "|".join(origins),
-                    "destinations": "|".join(destinations),
-                    "mode": mode,
-                    "key": api_key,
-                },
+                [
+                    {
+                        "origins": origins_param,
+                        "destinations": destinations_param,
+                        "mode": mode,
+                        "key": api_key,
+                    }
+                    for origins_param in joined_origins
+                    for destinations_param in joined_destinations
+                ],
             )
-            require_ok_status(data, "Distance matrix request failed")
+            for data in responses:
+                require_ok_status(data, "Distance matrix request failed")
 
-            result = {
-                "origin_addresses": data.get("origin_addresses", []),
-                "destination_addresses": data.get("destination_addresses", []),
-                "rows": data.get("rows", [])
-            }
+            result = merge_matrix_responses(responses, len(destination_chunks))
 
-            # Cache the result
-            cache_response(cache_key, result)
+            text = format_distance_matrix(result)
+            # Cache the result along with the formatted text
+            cache_response(cache_key, result, formatted=text)
 
             await ctx.info("Successfully calculated distance matrix")
-            return text_response(format_distance_matrix(result))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error calculating distance matrix: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "calculating distance matrix")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -412,47 +502,56 @@ def register(mcp: FastMCP) -> None:
 
         Returns:
             Elevation data for each provided location.
+            Cached results are shared by locations within about 11 m of each other.
         """
         await ctx.info(f"Getting elevation for {len(locations)} locations")
         validate_locations(locations)
 
         # Build cache key from locations
         location_strings = [f"{loc['latitude']},{loc['longitude']}" for loc in locations]
-        cache_key = f"elevation:{'|'.join(location_strings)}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key(
+            "elevation",
+            locations=[
+                (round(loc["latitude"], ELEVATION_KEY_PRECISION), round(loc["longitude"], ELEVATION_KEY_PRECISION))
+                for loc in locations
+            ],
+        )
+        cached_text = get_cached_text(cache_key, format_elevation_results)
+        if cached_text is not None:
             await ctx.info("Retrieved elevation data from cache")
-            return text_response(format_elevation_results(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
             api_key = await get_or_elicit_api_key(ctx)
-            location_string = "|".join(location_strings)
-            data = await get_json(
+            responses = await get_json_many(
                 "elevation/json",
-                {"locations": location_string, "key": api_key},
+                [
+                    {"locations": "|".join(chunk), "key": api_key}
+                    for chunk in chunked(location_strings, MAX_ELEVATION_LOCATIONS)
+                ],
             )
-            require_ok_status(data, "Elevation request failed")
 
             results = []
-            for result in data.get("results", []):
-                elevation_data = {
-                    "elevation": result.get("elevation"),
-                    "location": result.get("location"),
-                    "resolution": result.get("resolution")
-                }
-                results.append(elevation_data)
+            for data in responses:
+                require_ok_status(data, "Elevation request failed")
+                for result in data.get("results", []):
+                    elevation_data = {
+                        "elevation": result.get("elevation"),
+                        "location": result.get("location"),
+                        "resolution": result.get("resolution")
+                    }
+                    results.append(elevation_data)
 
-            # Cache the results
-            cache_response(cache_key, results)
+            text = format_elevation_results(results)
+            # Cache the results along with the formatted text
+            cache_response(cache_key, results, formatted=text)
 
             await ctx.info("Successfully retrieved elevation data")
-            return text_response(format_elevation_results(results))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error getting elevation data: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "getting elevation data")
 
     @mcp.tool(
         annotations={"readOnlyHint": True, "idempotentHint": True, "openWorldHint": True},
@@ -482,11 +581,11 @@ def register(mcp: FastMCP) -> None:
         mode = validate_mode(mode)
 
         # Build cache key
-        cache_key = f"directions:{origin}:{destination}:{mode}"
-        cached_result = get_cached_response(cache_key)
-        if cached_result:
+        cache_key = make_cache_key("directions", origin=origin, destination=destination, mode=mode)
+        cached_text = get_cached_text(cache_key, format_directions_result)
+        if cached_text is not None:
             await ctx.info("Retrieved directions from cache")
-            return text_response(format_directions_result(cached_result))
+            return text_response(cached_text)
 
         try:
             await ensure_external_call_consent(ctx)
@@ -526,13 +625,12 @@ def register(mcp: FastMCP) -> None:
 
             result = {"routes": routes}
 
-            # Cache the result
-            cache_response(cache_key, result)
+            text = format_directions_result(result)
+            # Cache the result along with the formatted text
+            cache_response(cache_key, result, formatted=text)
 
             await ctx.info("Successfully retrieved directions")
-            return text_response(format_directions_result(result))
+            return text_response(text)
 
-        except GoogleMapsApiError as e:
-            return text_response(format_error_message(str(e)))
-        except Exception as e:
-            return text_response(format_error_message(f"Error getting directions: {str(e)}"))
+        except EXPECTED_TOOL_ERRORS as e:
+            return error_response(e, "getting directions")
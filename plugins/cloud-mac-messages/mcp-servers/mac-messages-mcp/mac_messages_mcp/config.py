@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Literal
 
@@ -111,14 +113,11 @@ def _split_patterns(secret_value: str) -> list[str]:
     return [part.strip() for part in secret_value.split(",") if part.strip()]
 
 
-def get_runtime_config(profile_override: str | None = None) -> RuntimeConfig:
-    """Load runtime config from first matching profile path or defaults."""
-    profile_name = resolve_profile_name(profile_override)
-    source_path = next((p for p in candidate_profile_paths(profile_name) if p.exists()), None)
-
-    if source_path is None:
-        return RuntimeConfig(profile_name=profile_name, source_path=None)
-
+@functools.lru_cache(maxsize=8)
+def _load_profile_config(
+    profile_name: str, source_path: Path, mtime_ns: int, size: int
+) -> tuple[RuntimeConfig, str | None]:
+    """Parse and validate a profile file; cached until the file changes."""
     data = _load_profile_data(source_path)
 
     confirmation_policy = _parse_confirmation_policy(data.get("confirmation_policy"))
@@ -130,47 +129,81 @@ def get_runtime_config(profile_override: str | None = None) -> RuntimeConfig:
     if secret_ref is not None:
         if not isinstance(secret_ref, str) or not secret_ref.startswith("secret://"):
             raise ConfigError("allowed_recipients_secret must be a secret:// URI.")
-        try:
-            secret_value = resolve_secret_uri(secret_ref)
-        except SecretResolutionError as exc:
-            raise ConfigError("Unable to resolve profile secrets; backend not configured.") from exc
-        allowed_recipients.extend(_split_patterns(secret_value))
 
-    deduped = tuple(dict.fromkeys(allowed_recipients))
-    return RuntimeConfig(
+    config = RuntimeConfig(
         profile_name=profile_name,
         source_path=source_path,
         confirmation_policy=confirmation_policy,
-        allowed_recipients=deduped,
+        allowed_recipients=tuple(dict.fromkeys(allowed_recipients)),
         allow_group_messages=allow_group_messages,
         default_hours=default_hours,
     )
+    return config, secret_ref
 
 
-def _normalize_phone(raw: str) -> str:
-    return "".join(ch for ch in raw if ch.isdigit())
+def get_runtime_config(profile_override: str | None = None) -> RuntimeConfig:
+    """Load runtime config from first matching profile path or defaults."""
+    profile_name = resolve_profile_name(profile_override)
+    for source_path in candidate_profile_paths(profile_name):
+        try:
+            stat = source_path.stat()
+        except OSError:
+            continue
+        break
+    else:
+        return RuntimeConfig(profile_name=profile_name, source_path=None)
 
+    config, secret_ref = _load_profile_config(profile_name, source_path, stat.st_mtime_ns, stat.st_size)
+    if secret_ref is None:
+        return config
 
-def _match_pattern(recipient: str, pattern: str) -> bool:
-    pattern_norm = pattern.strip().lower()
-    recipient_norm = recipient.strip().lower()
+    # Secrets are resolved on every call so rotated values apply without a profile edit
+    try:
+        secret_value = resolve_secret_uri(secret_ref)
+    except SecretResolutionError as exc:
+        raise ConfigError("Unable to resolve profile secrets; backend not configured.") from exc
 
-    if "*" in pattern_norm:
-        import fnmatch
+    deduped = tuple(dict.fromkeys(config.allowed_recipients + tuple(_split_patterns(secret_value))))
+    return replace(config, allowed_recipients=deduped)
 
-        return fnmatch.fnmatch(recipient_norm, pattern_norm)
 
-    if "@" in recipient_norm or "@" in pattern_norm:
-        return recipient_norm == pattern_norm
+def _normalize_phone(raw: str) -> str:
+    return "".join(ch for ch in raw if ch.isdigit())
 
-    return _normalize_phone(recipient_norm) == _normalize_phone(pattern_norm)
+
+@functools.lru_cache(maxsize=8)
+def _compile_allowlist(
+    allowed_recipients: tuple[str, ...],
+) -> tuple[frozenset[str], frozenset[str], tuple[re.Pattern[str], ...]]:
+    """Split allowlist patterns into exact email and phone sets plus compiled wildcards."""
+    emails: set[str] = set()
+    phones: set[str] = set()
+    wildcards: list[re.Pattern[str]] = []
+    for pattern in allowed_recipients:
+        pattern_norm = pattern.strip().lower()
+        if "*" in pattern_norm:
+            wildcards.append(re.compile(fnmatch.translate(pattern_norm)))
+        elif "@" in pattern_norm:
+            emails.add(pattern_norm)
+        else:
+            phones.add(_normalize_phone(pattern_norm))
+    return frozenset(emails), frozenset(phones), tuple(wildcards)
 
 
 def recipient_is_allowed(recipient: str, allowed_recipients: tuple[str, ...]) -> bool:
     """Return True if recipient matches any configured allowlist pattern."""
     if not allowed_recipients:
         return False
-    return any(_match_pattern(recipient, pattern) for pattern in allowed_recipients)
+    emails, phones, wildcards = _compile_allowlist(tuple(allowed_recipients))
+    recipient_norm = recipient.strip().lower()
+
+    # Emails only ever equal email patterns, and phones compare by digits
+    if "@" in recipient_norm:
+        if recipient_norm in emails:
+            return True
+    elif _normalize_phone(recipient_norm) in phones:
+        return True
+    return any(wildcard.match(recipient_norm) for wildcard in wildcards)
 
 
 def requires_confirmation(
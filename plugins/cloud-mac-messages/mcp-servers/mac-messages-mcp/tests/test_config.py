@@ -1,8 +1,14 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from mac_messages_mcp.config import ConfigError, get_runtime_config, resolve_profile_name
+from mac_messages_mcp.config import (
+    ConfigError,
+    get_runtime_config,
+    recipient_is_allowed,
+    resolve_profile_name,
+)
 
 
 def _write_profile(base: Path, name: str, content: str) -> Path:
@@ -64,3 +70,36 @@ def test_unsupported_secret_backend_fails_closed(
 
     with pytest.raises(ConfigError, match="Unable to resolve profile secrets"):
         get_runtime_config()
+
+
+def test_profile_edits_invalidate_cached_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    profile_path = _write_profile(tmp_path, "default", 'confirmation_policy = "never"\n')
+    assert get_runtime_config().confirmation_policy == "never"
+
+    profile_path.write_text('confirmation_policy = "always"\n')
+    os.utime(profile_path, ns=(0, profile_path.stat().st_mtime_ns + 1_000_000_000))
+    assert get_runtime_config().confirmation_policy == "always"
+
+
+def test_secret_is_reread_with_unchanged_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ALLOWED_RECIPIENTS", "alice@example.com")
+    _write_profile(
+        tmp_path,
+        "default",
+        'allowed_recipients = ["+15551234567"]\nallowed_recipients_secret = "secret://env/ALLOWED_RECIPIENTS"\n',
+    )
+    assert get_runtime_config().allowed_recipients == ("+15551234567", "alice@example.com")
+
+    monkeypatch.setenv("ALLOWED_RECIPIENTS", "bob@example.com")
+    assert get_runtime_config().allowed_recipients == ("+15551234567", "bob@example.com")
+
+
+def test_recipient_allowlist_matching() -> None:
+    allowlist = ("+1 (555) 123-4567", "Alice@Example.com", "*@corp.example")
+    assert recipient_is_allowed("15551234567", allowlist)
+    assert recipient_is_allowed(" alice@example.com", allowlist)
+    assert recipient_is_allowed("bob@corp.example", allowlist)
+    assert not recipient_is_allowed("+15557654321", allowlist)
+    assert not recipient_is_allowed("alice@example.org", allowlist)
@@ -3,10 +3,15 @@
 
 import argparse
 import difflib
+import mmap
+import os
 import sys
 import unicodedata
 import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
 
 
 def is_text_file(file_path: Path, chunk_size: int = 1024) -> bool:
@@ -18,40 +23,205 @@ def is_text_file(file_path: Path, chunk_size: int = 1024) -> bool:
         return False
 
 
-def calculate_crc32(file_path: Path, chunk_size: int = 65536) -> str:
-    crc = 0
+def calculate_crc32(file_path: Path) -> str:
+    # Hand the whole mapped file to zlib in one call: it chunks internally,
+    # releases the GIL, and uses its folded (PCLMUL) kernel where the build has one.
     with open(file_path, 'rb') as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            crc = zlib.crc32(chunk, crc)
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                crc = zlib.crc32(mm)
+        except ValueError:
+            # Empty files cannot be mapped
+            crc = zlib.crc32(f.read())
     return f"{crc & 0xffffffff:08x}"
 
 
-def normalize_text(text: str, args) -> str:
-    if args.unicode_normalize:
-        text = unicodedata.normalize('NFKC', text)
+def read_text(file_path: Path) -> str:
+    """Read a file as UTF-8 with universal newlines, as text-mode open() does."""
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Without a CR there is no newline translation to do, so decode
+                # straight from the mapped pages in one call
+                if mm.find(b'\r') == -1:
+                    return str(mm, 'utf-8', 'replace')
+        except ValueError:
+            # Empty files cannot be mapped
+            return ''
+    # The text layer translates CR/CRLF chunk by chunk, which beats decoding
+    # everything first and rewriting the whole string afterwards
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+@contextmanager
+def _map_or_empty(f) -> Iterator:
+    """Map an open file read-only; empty files cannot be mapped and yield b''."""
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        yield b''
+        return
+    with mm:
+        yield mm
+
+
+def calculate_crc32_pair(left: Path, right: Path,
+                         chunk_size: int = 1 << 20) -> Optional[Tuple[str, str]]:
+    """CRC32 two files, hashing only one side while their bytes agree.
     
-    if args.normalize_tabs:
-        text = text.expandtabs()
+    Lengths come from the mappings, not an earlier stat(), so a file that
+    changed in between is never hashed only in part. Returns None when the
+    files' current lengths differ.
+    """
+    with open(left, 'rb') as lf, open(right, 'rb') as rf, \
+            _map_or_empty(lf) as lm, _map_or_empty(rf) as rm:
+        size = len(lm)
+        if len(rm) != size:
+            return None
+        
+        crc = 0
+        offset = 0
+        while offset < size:
+            left_chunk = lm[offset:offset + chunk_size]
+            if not left_chunk or left_chunk != rm[offset:offset + chunk_size]:
+                break
+            crc = zlib.crc32(left_chunk, crc)
+            offset += len(left_chunk)
+        else:
+            crc_hex = f"{crc & 0xffffffff:08x}"
+            return crc_hex, crc_hex
+        
+        # First mismatch: finish each side's CRC from here, in parallel since
+        # zlib.crc32 releases the GIL
+        with memoryview(lm) as lv, memoryview(rm) as rv, ThreadPoolExecutor(max_workers=2) as executor:
+            left_crc, right_crc = executor.map(
+                lambda view: zlib.crc32(view[offset:], crc), (lv, rv))
+    return f"{left_crc & 0xffffffff:08x}", f"{right_crc & 0xffffffff:08x}"
+
+
+# Line boundaries str.splitlines() honours besides '\n'; when none occur the
+# text can be split on '\n' alone and rejoined without re-adding terminators
+_OTHER_LINE_BREAKS = '\r\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+def _nfkc(text: str) -> str:
+    return unicodedata.normalize('NFKC', text)
+
+
+# Membership tests are memchr scans, far cheaper than a rewrite pass that
+# would copy the text unchanged
+def _expand_tabs(text: str) -> str:
+    return text.expandtabs() if '\t' in text else text
+
+
+def _unify_newlines(text: str) -> str:
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+
+def _make_line_filter(ignore_whitespace: bool, ignore_blank: bool) -> Callable[[str], str]:
+    def filter_lines(text: str) -> str:
+        if not any(ch in text for ch in _OTHER_LINE_BREAKS):
+            lines = text.split('\n')
+            if ignore_whitespace:
+                lines = [line.strip() for line in lines]
+            if ignore_blank:
+                # The piece after the last '\n' has no terminator of its own
+                tail = lines.pop()
+                lines = [line for line in lines if line.strip()]
+                lines.append(tail if tail.strip() else '')
+            return '\n'.join(lines)
+        
+        lines = text.splitlines(keepends=True)
+        
+        if ignore_whitespace:
+            lines = [line.strip() + ('\n' if line.endswith(('\n', '\r\n', '\r')) else '') 
+                    for line in lines]
+        
+        if ignore_blank:
+            lines = [line for line in lines if line.strip()]
+        
+        return ''.join(lines)
     
+    return filter_lines
+
+
+def build_normalizer(args) -> Callable[[str], str]:
+    """Resolve the normalization options once into the list of steps to apply."""
+    steps = []
+    if args.unicode_normalize:
+        steps.append(_nfkc)
+    if args.normalize_tabs:
+        steps.append(_expand_tabs)
     if args.ignore_newlines:
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
+        steps.append(_unify_newlines)
     if args.ignore_case:
-        text = text.lower()
+        steps.append(str.lower)
+    if args.ignore_whitespace or args.ignore_blank:
+        steps.append(_make_line_filter(args.ignore_whitespace, args.ignore_blank))
     
-    lines = text.splitlines(keepends=True)
+    def normalize(text: str) -> str:
+        for step in steps:
+            text = step(text)
+        return text
     
-    if args.ignore_whitespace:
-        lines = [line.strip() + ('\n' if line.endswith(('\n', '\r\n', '\r')) else '') 
-                for line in lines]
-    
-    if args.ignore_blank:
-        lines = [line for line in lines if line.strip()]
-    
-    return ''.join(lines)
+    return normalize
+
+
+def normalize_text(text: str, args) -> str:
+    return build_normalizer(args)(text)
+
+
+def _normalized_blocks(file_path: Path, normalize: Callable[[str], str],
+                       block_size: int) -> Iterator[str]:
+    """Yield the normalized text of a file in blocks cut at line boundaries."""
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        # Pieces of the unfinished last line; joined only once a newline ends
+        # it, so a file with very long lines is not re-copied on every read
+        carry = []
+        while True:
+            chunk = f.read(block_size)
+            if not chunk:
+                break
+            # Every step works line by line, so normalizing whole lines at a
+            # time gives the same text as normalizing the file at once
+            cut = chunk.rfind('\n') + 1
+            if not cut:
+                carry.append(chunk)
+                continue
+            carry.append(chunk[:cut])
+            yield normalize(''.join(carry))
+            carry = [chunk[cut:]] if cut < len(chunk) else []
+        if carry:
+            yield normalize(''.join(carry))
+
+
+def normalized_equal(left: Path, right: Path, normalize: Callable[[str], str],
+                     block_size: int = 1 << 20) -> bool:
+    """Compare two files after normalization, stopping at the first difference."""
+    left_blocks = _normalized_blocks(left, normalize, block_size)
+    right_blocks = _normalized_blocks(right, normalize, block_size)
+    left_buf = right_buf = ''
+    while True:
+        while not left_buf:
+            block = next(left_blocks, None)
+            if block is None:
+                break
+            left_buf = block
+        while not right_buf:
+            block = next(right_blocks, None)
+            if block is None:
+                break
+            right_buf = block
+        if not left_buf or not right_buf:
+            return not left_buf and not right_buf
+        
+        # Normalized blocks rarely line up, so compare the overlap and carry the rest
+        n = min(len(left_buf), len(right_buf))
+        if left_buf[:n] != right_buf[:n]:
+            return False
+        left_buf = left_buf[n:]
+        right_buf = right_buf[n:]
 
 
 def format_size(size: int) -> str:
@@ -62,6 +232,36 @@ def format_size(size: int) -> str:
     return f"{size} bytes"
 
 
+def report_crc_comparison(left: Path, right: Path, left_stat: os.stat_result,
+                          right_stat: os.stat_result, label: str = '') -> None:
+    if left_stat.st_size != right_stat.st_size:
+        # Files of different sizes can never match, so skip reading them
+        print(f"DIFFERENT{label}")
+        print(f"left: {left.name} ({format_size(left_stat.st_size)})")
+        print(f"right: {right.name} ({format_size(right_stat.st_size)})")
+        return
+    
+    if os.path.samestat(left_stat, right_stat):
+        # Both paths name the same file (same device and inode): hash it once
+        left_crc = right_crc = calculate_crc32(left)
+    else:
+        crcs = calculate_crc32_pair(left, right)
+        if crcs is None:
+            # A file changed length since it was stat'ed: report its current size
+            report_crc_comparison(left, right, left.stat(), right.stat(), label)
+            return
+        left_crc, right_crc = crcs
+    
+    if left_crc == right_crc:
+        print(f"IDENTICAL{label}")
+        print(f"left: {left.name} ({left_crc})")
+        print(f"right: {right.name} ({right_crc})")
+    else:
+        print(f"DIFFERENT{label}")
+        print(f"left: {left.name} ({format_size(left_stat.st_size)}, {left_crc})")
+        print(f"right: {right.name} ({format_size(right_stat.st_size)}, {right_crc})")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Compare two files')
     parser.add_argument('left', help='Path to first file')
@@ -74,6 +274,8 @@ def main():
     parser.add_argument('--ignore-case', action='store_true', help='Case-insensitive comparison')
     parser.add_argument('--normalize-tabs', action='store_true', help='Convert tabs to spaces')
     parser.add_argument('--unicode-normalize', action='store_true', help='Apply Unicode NFKC normalization')
+    parser.add_argument('--assume-text', action='store_true',
+                       help='Skip the text/binary probe and treat both files as text')
     args = parser.parse_args()
     
     left = Path(args.left)
@@ -96,49 +298,20 @@ def main():
     try:
         left_stat = left.stat()
         right_stat = right.stat()
-        left_is_text = is_text_file(left)
-        right_is_text = is_text_file(right)
+        # Binary mode ignores the file type, so only probe contents when it matters
+        both_text = args.mode != 'binary' and (
+            args.assume_text or (is_text_file(left) and is_text_file(right)))
         
-        if args.mode == 'binary' or (not left_is_text or not right_is_text):
-            left_crc = calculate_crc32(left)
-            right_crc = calculate_crc32(right)
-            
-            if left_crc == right_crc:
-                print("IDENTICAL (binary)")
-                print(f"left: {left.name} ({left_crc})")
-                print(f"right: {right.name} ({right_crc})")
-            else:
-                print("DIFFERENT (binary)")
-                print(f"left: {left.name} ({format_size(left_stat.st_size)}, {left_crc})")
-                print(f"right: {right.name} ({format_size(right_stat.st_size)}, {right_crc})")
+        if not both_text:
+            report_crc_comparison(left, right, left_stat, right_stat, " (binary)")
         
         elif args.mode == 'exact':
-            left_crc = calculate_crc32(left)
-            right_crc = calculate_crc32(right)
-            
-            if left_crc == right_crc:
-                print("IDENTICAL")
-                print(f"left: {left.name} ({left_crc})")
-                print(f"right: {right.name} ({right_crc})")
-            else:
-                print("DIFFERENT")
-                print(f"left: {left.name} ({format_size(left_stat.st_size)}, {left_crc})")
-                print(f"right: {right.name} ({format_size(right_stat.st_size)}, {right_crc})")
+            report_crc_comparison(left, right, left_stat, right_stat)
         
         elif args.mode == 'smart':
-            if not left_is_text or not right_is_text:
-                print("ERROR: Smart mode requires both files to be text", file=sys.stderr)
-                sys.exit(1)
-            
-            with open(left, 'r', encoding='utf-8', errors='replace') as f:
-                left_content = f.read()
-            with open(right, 'r', encoding='utf-8', errors='replace') as f:
-                right_content = f.read()
-            
-            left_normalized = normalize_text(left_content, args)
-            right_normalized = normalize_text(right_content, args)
+            normalize = build_normalizer(args)
             
-            if left_normalized == right_normalized:
+            if normalized_equal(left, right, normalize):
                 normalizations = []
                 if args.ignore_case: normalizations.append("case")
                 if args.ignore_whitespace: normalizations.append("whitespace")
@@ -159,19 +332,20 @@ def main():
                 print("")
                 print("diff:")
                 
-                left_lines = left_normalized.splitlines(keepends=True)
-                right_lines = right_normalized.splitlines(keepends=True)
+                # Only a real difference needs both files in memory
+                left_lines = normalize(read_text(left)).splitlines(keepends=True)
+                right_lines = normalize(read_text(right)).splitlines(keepends=True)
                 
-                diff_lines = list(difflib.unified_diff(
+                diff_lines = difflib.unified_diff(
                     left_lines,
                     right_lines,
                     fromfile=str(left),
                     tofile=str(right),
                     lineterm=''
-                ))
+                )
                 
-                for line in diff_lines:
-                    print(line)
+                # Stream hunks straight to stdout as difflib yields them
+                sys.stdout.writelines(f"{line}\n" for line in diff_lines)
     
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
@@ -1,8 +1,8 @@
-import requests
 import json
 from hashlib import md5
 from dotenv import load_dotenv
 import os
+from http_session import session
 
 # Yes - you read that right. You log in with raw MD5 hash of your password.
 # Note to Self: Do not use sensitive password on JEFit.
@@ -23,7 +23,7 @@ def get_access_token() -> str:
         "passwordMd5": md5(password.encode()).hexdigest()
     }
 
-    response = requests.post(
+    response = session.post(
         "https://www.jefit.com/api/v2/auth/login",
         headers={'content-type': 'application/json'},
         data=json.dumps(data)
@@ -41,7 +41,7 @@ def get_user_id(access_token: str) -> str:
         'content-type': 'application/json',
         'Cookie': f'jefitAccessToken={access_token}'
     }
-    response = requests.get("https://www.jefit.com/api/v2/user", headers=headers)
+    response = session.get("https://www.jefit.com/api/v2/user", headers=headers)
     if response.status_code != 200:
         raise Exception(f"Failed to get user info from JEFit: status={response.status_code}")
     else:
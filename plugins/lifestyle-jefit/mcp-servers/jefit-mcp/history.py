@@ -1,8 +1,8 @@
-import requests
 import json
 import os 
 from dotenv import load_dotenv
 from auth import get_access_token, get_user_id
+from http_session import session
 load_dotenv()
 
 def get_workout_history() -> list[str]:
@@ -14,7 +14,7 @@ def get_workout_history() -> list[str]:
         'content-type': 'application/json',
         'Cookie': f'jefitAccessToken={access_token}'
     }
-    response = requests.get(f"https://www.jefit.com/api/v2/users/{user_id}/sessions/calendar?timezone_offset={timezone_offset}", headers=headers)
+    response = session.get(f"https://www.jefit.com/api/v2/users/{user_id}/sessions/calendar?timezone_offset={timezone_offset}", headers=headers)
     if response.status_code != 200:
         raise Exception(f"Failed to get workout history: status={response.status_code}")
     else:
@@ -0,0 +1,16 @@
+"""Shared HTTP session for JEFit API calls."""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# At least server.MAX_CONCURRENT_FETCHES, so batch fetches keep every pooled connection
+POOL_SIZE = 16
+
+# One keep-alive session: repeated calls reuse TLS connections instead of
+# paying DNS + handshake per request
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_maxsize=POOL_SIZE))
+# Each call sends its own jefitAccessToken cookie; don't carry response cookies between calls
+session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
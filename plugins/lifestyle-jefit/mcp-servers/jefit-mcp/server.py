@@ -57,15 +57,23 @@ Place this configuration in:
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 from typing import cast
-from datetime import datetime, date
+from datetime import date
 from fastmcp import FastMCP
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from auth import get_access_token, get_user_id
 from history import get_workout_history
-from workout_info import format_workout_markdown, get_workout_for_date, load_exercise_db
+from workout_info import (
+    fetch_sessions_for_date,
+    format_workout_markdown,
+    get_workout_for_date,
+    load_exercise_db,
+)
 
 # Initialize FastMCP server
 mcp = FastMCP(
@@ -77,10 +85,25 @@ mcp = FastMCP(
     """
 )
 
+# Upper bound on simultaneous JEFit requests made by get_batch_workouts
+MAX_CONCURRENT_FETCHES = 16
+# Created once and reused by every batch call instead of spinning up threads per call
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="jefit-fetch")
+
 _EXERCISE_DB: dict[str, dict] | None = None
 _EXERCISE_DB_LOCK = Lock()
 
 
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+def parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD date without strptime's per-call format handling."""
+    if not _DATE_RE.fullmatch(value):
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d'")
+    return date.fromisoformat(value)
+
+
 def get_exercise_db() -> dict[str, dict]:
     """Lazily load the exercise database after MCP handshake."""
     global _EXERCISE_DB
@@ -118,8 +141,8 @@ def list_workout_dates(start_date: str, end_date: str | None = None) -> list[str
     
     # Validate date formats
     try:
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start = parse_date(start_date)
+        end = parse_date(end_date)
     except ValueError as e:
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
     
@@ -129,12 +152,11 @@ def list_workout_dates(start_date: str, end_date: str | None = None) -> list[str
     # Get all workout dates from API
     all_dates = get_workout_history()
     
-    # Filter to date range
-    filtered_dates = []
-    for workout_date_str in all_dates:
-        workout_date = datetime.strptime(workout_date_str, "%Y-%m-%d").date()
-        if start <= workout_date <= end:
-            filtered_dates.append(workout_date_str)
+    # Filter to date range; YYYY-MM-DD strings order the same as the dates
+    filtered_dates = [
+        workout_date_str for workout_date_str in all_dates
+        if start_date <= workout_date_str <= end_date
+    ]
     
     return sorted(filtered_dates)
 
@@ -158,7 +180,7 @@ def get_workout_info(date: str) -> ToolResult:
     """
     # Validate date format
     try:
-        datetime.strptime(date, "%Y-%m-%d")
+        parse_date(date)
     except ValueError as e:
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
     
@@ -192,17 +214,28 @@ def get_batch_workouts(dates: list[str]) -> ToolResult:
     # Validate all date formats first
     for date_str in dates:
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            parse_date(date_str)
         except ValueError as e:
             raise ValueError(f"Invalid date format '{date_str}'. Use YYYY-MM-DD format: {e}")
     
+    # Log in once for the whole batch; parallel per-date logins would hammer
+    # JEFit's auth endpoint
+    access_token = get_access_token()
+    user_id = get_user_id(access_token)
+    
+    # Fetch every date concurrently; map() keeps results in sorted-date order
+    sorted_dates = sorted(dates)
+    workouts = list(_FETCH_EXECUTOR.map(
+        lambda date_str: fetch_sessions_for_date(date_str, access_token, user_id),
+        sorted_dates,
+    ))
+    
     # Build combined markdown output
-    all_workouts = []
     exercise_db = get_exercise_db()
-
-    for date_str in sorted(dates):
-        workout_data = get_workout_for_date(date_str)
-        all_workouts.append(format_workout_markdown(date_str, workout_data, exercise_db))
+    all_workouts = [
+        format_workout_markdown(date_str, workout_data, exercise_db)
+        for date_str, workout_data in zip(sorted_dates, workouts)
+    ]
     
     # Join all workouts with separator
     markdown_text = "\n---\n\n".join(all_workouts)
@@ -55,7 +55,14 @@ async def test_get_batch_workouts_sorts_dates(client, monkeypatch):
         "2025-10-15": {"data": []},
     }
 
-    monkeypatch.setattr(server, "get_workout_for_date", lambda date: data_by_date[date])
+    logins = []
+    monkeypatch.setattr(server, "get_access_token", lambda: logins.append(1) or "token")
+    monkeypatch.setattr(server, "get_user_id", lambda token: "user-1")
+    monkeypatch.setattr(
+        server,
+        "fetch_sessions_for_date",
+        lambda date, token, user_id: data_by_date[date],
+    )
     monkeypatch.setattr(
         server,
         "get_exercise_db",
@@ -69,3 +76,4 @@ async def test_get_batch_workouts_sorts_dates(client, monkeypatch):
     text = result.content[0].text
     assert text.index("# Workout for 2025-10-15") < text.index("# Workout for 2025-10-17")
     assert "Bench Press" in text
+    assert len(logins) == 1
@@ -4,12 +4,14 @@ This script fetches workout logs from the API and enriches them with
 exercise details (names, muscle groups, equipment) from the cached database.
 """
 
-import requests
 import json
+import os
+import pickle
 import time
 from datetime import datetime
 from pathlib import Path
 from auth import get_access_token, get_user_id
+from http_session import session
 
 def fetch_exercise_database() -> dict[str, dict]:
     """Fetch the full exercise database from RSC endpoint"""
@@ -21,7 +23,7 @@ def fetch_exercise_database() -> dict[str, dict]:
         'Cookie': f'jefitAccessToken={get_access_token()}'
     }
     
-    response = requests.get("https://www.jefit.com/my-jefit/progress/history", headers=headers)
+    response = session.get("https://www.jefit.com/my-jefit/progress/history", headers=headers)
     chunks = rsc_parser.parse_rsc_response(response.text)
     
     exercises_db = {}
@@ -57,9 +59,37 @@ def fetch_exercise_database() -> dict[str, dict]:
     return exercises_db
 
 
+EXERCISE_DB_PATH = Path('data/exercises_db.json')
+# Pickled copy of the parsed JSON; unpickling skips json parsing on every server start
+EXERCISE_DB_CACHE_PATH = EXERCISE_DB_PATH.with_suffix('.pickle')
+
+
+def _read_exercise_db_cache(db_path: Path, cache_path: Path) -> dict[str, dict] | None:
+    """Return the pickled exercise database if it is at least as new as the JSON"""
+    try:
+        if cache_path.stat().st_mtime_ns < db_path.stat().st_mtime_ns:
+            return None
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_exercise_db_cache(exercises: dict[str, dict], cache_path: Path) -> None:
+    """Write the pickle via rename so a concurrent start never reads a partial file"""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(exercises, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 def load_exercise_db() -> dict[str, dict]:
     """Load exercise database from JSON cache, creating it if necessary"""
-    db_path = Path('data/exercises_db.json')
+    db_path = EXERCISE_DB_PATH
+    cache_path = EXERCISE_DB_CACHE_PATH
     
     # Create data directory if it doesn't exist
     db_path.parent.mkdir(exist_ok=True)
@@ -77,6 +107,7 @@ def load_exercise_db() -> dict[str, dict]:
             # Save to JSON
             with open(db_path, 'w') as f:
                 json.dump(exercises, f, indent=2)
+            _write_exercise_db_cache(exercises, cache_path)
             
             print(f"✓ Created exercise database with {len(exercises)} exercises")
             return exercises
@@ -85,27 +116,38 @@ def load_exercise_db() -> dict[str, dict]:
             print(f"⚠️  Failed to fetch exercise database: {e}")
             return {}
     
+    cached = _read_exercise_db_cache(db_path, cache_path)
+    if cached is not None:
+        return cached
+    
     # Load existing database
     try:
         with open(db_path, 'r') as f:
-            return json.load(f)
+            exercises = json.load(f)
+        _write_exercise_db_cache(exercises, cache_path)
+        return exercises
     except Exception as e:
         print(f"⚠️  Error loading exercise database: {e}")
         return {}
 
 def get_workout_for_date(date_str: str) -> dict:
     """Get workout logs for a specific date"""
-    date_unix = int(time.mktime(time.strptime(date_str, "%Y-%m-%d")))
     # Get Access Token and User ID
     access_token = get_access_token()
     user_id = get_user_id(access_token)
+    return fetch_sessions_for_date(date_str, access_token, user_id)
+
+
+def fetch_sessions_for_date(date_str: str, access_token: str, user_id: str) -> dict:
+    """Get workout logs for a specific date with an existing login"""
+    date_unix = int(time.mktime(time.strptime(date_str, "%Y-%m-%d")))
     url = f"https://www.jefit.com/api/v2/users/{user_id}/sessions?startDate={date_unix}"
     headers = {
         'content-type': 'application/json',
         'Cookie': f'jefitAccessToken={access_token}'
     }
     
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     if response.status_code != 200:
         raise Exception(f"Failed to get workout details: status={response.status_code}")
     return response.json()
@@ -7,19 +7,61 @@ Supports both browser cookie authentication and environment-based cookies.
 
 import sys
 import json
+import asyncio
+import hashlib
 from pathlib import Path
 from datetime import date, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional
 from http.cookiejar import Cookie, CookieJar
 
 # Add myfitnesspal library to path
 myfitnesspal_path = Path(__file__).parent / "myfitnesspal"
 sys.path.insert(0, str(myfitnesspal_path))
 
+# Clients by cookie payload digest, see MyFitnessPalClient.get
+_client_cache: dict[str, "MyFitnessPalClient"] = {}
+
+
+def _build_cookie(name: str, data: dict) -> Cookie:
+    """Build a session cookie from one entry of the exported cookie JSON."""
+    return Cookie(
+        version=0,
+        name=name,
+        value=data['value'],
+        port=None,
+        port_specified=False,
+        domain=data.get('domain', '.myfitnesspal.com'),
+        domain_specified=True,
+        domain_initial_dot=data.get('domain', '').startswith('.'),
+        path=data.get('path', '/'),
+        path_specified=True,
+        secure=data.get('secure', False),
+        expires=None,
+        discard=True,
+        comment=None,
+        comment_url=None,
+        rest={},
+        rfc2109=False
+    )
+
 
 class MyFitnessPalClient:
     """Simplified client wrapping python-myfitnesspal library"""
     
+    @classmethod
+    def get(cls, cookies_json: str | None = None) -> "MyFitnessPalClient":
+        """
+        Return a shared client for this cookie payload, building it on first use.
+        
+        Keyed by a digest of the payload so the same cookies reuse one
+        cookie jar and HTTP session instead of re-parsing and reconnecting.
+        """
+        key = hashlib.blake2b((cookies_json or "").encode(), digest_size=16).hexdigest()
+        client = _client_cache.get(key)
+        if client is None:
+            client = _client_cache[key] = cls(cookies_json)
+        return client
+    
     def __init__(self, cookies_json: str | None = None):
         """
         Initialize client using cookies from profile/env fallback or browser.
@@ -49,26 +91,7 @@ class MyFitnessPalClient:
             jar = CookieJar()
             
             for name, data in cookie_dict.items():
-                cookie = Cookie(
-                    version=0,
-                    name=name,
-                    value=data['value'],
-                    port=None,
-                    port_specified=False,
-                    domain=data.get('domain', '.myfitnesspal.com'),
-                    domain_specified=True,
-                    domain_initial_dot=data.get('domain', '').startswith('.'),
-                    path=data.get('path', '/'),
-                    path_specified=True,
-                    secure=data.get('secure', False),
-                    expires=None,
-                    discard=True,
-                    comment=None,
-                    comment_url=None,
-                    rest={},
-                    rfc2109=False
-                )
-                jar.set_cookie(cookie)
+                jar.set_cookie(_build_cookie(name, data))
             
             return jar
             
@@ -104,3 +127,39 @@ class MyFitnessPalClient:
                 # Skip days with errors
                 pass
             current = current + timedelta(days=1)
+    
+    async def get_date_range_async(
+        self,
+        start_date: date,
+        end_date: date,
+        concurrency: int = 8,
+        read: Optional[Callable[[Any], Any]] = None,
+    ) -> list:
+        """
+        Get data for multiple days, fetching up to `concurrency` days at once.
+        
+        Returns Day objects (or `read(day)` when given) in date order. `read`
+        runs in the worker thread, so lazily loaded fields such as water and
+        exercises are fetched concurrently as well. Days whose fetch fails are
+        skipped; errors raised by `read` propagate.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        skipped = object()
+        
+        def fetch(target_date: date):
+            try:
+                day = self.get_day(target_date)
+            except Exception:
+                # Skip days with errors; failures in read() still propagate
+                return skipped
+            return read(day) if read else day
+        
+        async def fetch_bounded(target_date: date):
+            async with semaphore:
+                return await asyncio.to_thread(fetch, target_date)
+        
+        num_days = (end_date - start_date).days + 1
+        results = await asyncio.gather(
+            *(fetch_bounded(start_date + timedelta(days=i)) for i in range(num_days))
+        )
+        return [result for result in results if result is not skipped]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -55,7 +56,12 @@ def _profile_candidates(profile_name: str) -> list[Path]:
 def _load_profile(profile_name: str) -> tuple[dict[str, Any], Path] | tuple[None, None]:
     """Load first profile file found by precedence."""
     for candidate in _profile_candidates(profile_name):
-        if candidate.exists() and candidate.is_file():
+        # One stat per candidate instead of exists() followed by is_file()
+        try:
+            candidate_stat = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(candidate_stat.st_mode):
             raw = tomllib.loads(candidate.read_text(encoding="utf-8"))
             if not isinstance(raw, dict):
                 raise ConfigError("Profile file is invalid.")
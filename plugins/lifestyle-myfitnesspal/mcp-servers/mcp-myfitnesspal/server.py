@@ -49,7 +49,7 @@ def get_client() -> MyFitnessPalClient:
     
     if _client is None:
         runtime_config = load_runtime_config()
-        _client = MyFitnessPalClient(cookies_json=runtime_config.mfp_cookies)
+        _client = MyFitnessPalClient.get(runtime_config.mfp_cookies)
     
     return _client
 
@@ -384,8 +384,25 @@ def get_water_intake(date: Optional[str] = None) -> ToolResult:
         return text_response(format_tool_error("Error retrieving water intake", e))
 
 
+def summarize_day(day) -> dict:
+    """Extract the per-day figures used by get_date_range_summary"""
+    totals = day.totals
+    
+    return {
+        'date': day.date,
+        'calories': totals.get('calories', 0),
+        'carbs': totals.get('carbohydrates', 0),
+        'fat': totals.get('fat', 0),
+        'protein': totals.get('protein', 0),
+        'water_ml': day.water,  # Store as ml
+        'complete': day.complete,
+        'num_meals': len(day.meals),
+        'num_exercises': len(day.exercises)
+    }
+
+
 @mcp.tool(annotations=TOOL_ANNOTATIONS)
-def get_date_range_summary(start_date: str, end_date: str) -> ToolResult:
+async def get_date_range_summary(start_date: str, end_date: str) -> ToolResult:
     """
     Get aggregate nutrition data over a date range with trends and insights.
     
@@ -402,23 +419,9 @@ def get_date_range_summary(start_date: str, end_date: str) -> ToolResult:
         
         client = get_client()
         
-        # Collect data for each day
-        daily_data = []
-        
-        for day in client.get_date_range(start, end):
-            totals = day.totals
-            
-            daily_data.append({
-                'date': day.date,
-                'calories': totals.get('calories', 0),
-                'carbs': totals.get('carbohydrates', 0),
-                'fat': totals.get('fat', 0),
-                'protein': totals.get('protein', 0),
-                'water_ml': day.water,  # Store as ml
-                'complete': day.complete,
-                'num_meals': len(day.meals),
-                'num_exercises': len(day.exercises)
-            })
+        # Collect data for each day; water and exercises are separate requests,
+        # so they are read in the fetch threads alongside the diary page
+        daily_data = await client.get_date_range_async(start, end, read=summarize_day)
         
         if not daily_data:
             return text_response("No data available for the specified date range.")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from api_client import MyFitnessPalClient
+
+
+class StubbedClient(MyFitnessPalClient):
+    """MyFitnessPalClient with get_day stubbed out; skips the real login."""
+
+    def __init__(self, fail_on: set[date] | None = None) -> None:
+        self.fail_on = fail_on or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_day(self, target_date: date) -> date:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later dates finish first, so ordering can't come from completion order
+            time.sleep(0.02 * (32 - target_date.day) / 32)
+            if target_date in self.fail_on:
+                raise RuntimeError("fetch failed")
+            return target_date
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_date_range_async_keeps_order_and_skips_failed_days():
+    client = StubbedClient(fail_on={date(2026, 1, 3)})
+    days = await client.get_date_range_async(date(2026, 1, 1), date(2026, 1, 5))
+    assert days == [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 4), date(2026, 1, 5)]
+
+
+@pytest.mark.asyncio
+async def test_date_range_async_bounds_concurrency():
+    client = StubbedClient()
+    days = await client.get_date_range_async(date(2026, 1, 1), date(2026, 1, 20), concurrency=3)
+    assert len(days) == 20
+    assert 1 < client.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_date_range_async_propagates_read_errors():
+    client = StubbedClient()
+
+    def read(day: date) -> int:
+        if day.day == 2:
+            raise ValueError("water lookup failed")
+        return day.day
+
+    with pytest.raises(ValueError, match="water lookup failed"):
+        await client.get_date_range_async(date(2026, 1, 1), date(2026, 1, 3), read=read)
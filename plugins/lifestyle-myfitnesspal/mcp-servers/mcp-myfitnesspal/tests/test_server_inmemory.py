@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
 
 import pytest
 from fastmcp.client import Client
 
-import server
 from config import ConfigError
 
 
@@ -46,21 +45,18 @@ class FakeClient:
         self._day = day
 
     def get_day(self, target_date: date) -> FakeDay:
-        return FakeDay(
-            date=target_date,
-            totals=self._day.totals,
-            goals=self._day.goals,
-            water=self._day.water,
-            complete=self._day.complete,
-            meals=self._day.meals,
-            exercises=self._day.exercises,
-        )
+        return replace(self._day, date=target_date)
 
     def get_date_range(self, start_date: date, end_date: date):
+        base = self._day
         current = start_date
         while current <= end_date:
-            yield self.get_day(current)
-            current = current.fromordinal(current.toordinal() + 1)
+            yield replace(base, date=current)
+            current += timedelta(days=1)
+
+    async def get_date_range_async(self, start_date: date, end_date: date, concurrency: int = 8, read=None):
+        days = list(self.get_date_range(start_date, end_date))
+        return [read(day) for day in days] if read else days
 
 
 def first_text(result) -> str:
@@ -122,17 +118,25 @@ def fake_day() -> FakeDay:
     )
 
 
+@pytest.fixture(scope="session")
+def server_module():
+    # Imported here so collection doesn't build the FastMCP app and its tools
+    import server
+
+    return server
+
+
 @pytest.fixture
-async def client():
-    async with Client(transport=server.mcp) as c:
+async def client(server_module):
+    async with Client(transport=server_module.mcp) as c:
         yield c
 
 
 @pytest.fixture(autouse=True)
-def reset_global_client():
-    server._client = None
+def reset_global_client(server_module):
+    server_module._client = None
     yield
-    server._client = None
+    server_module._client = None
 
 
 @pytest.mark.asyncio
@@ -143,46 +147,35 @@ async def test_list_tools(client):
     assert "get_date_range_summary" in names
 
 
-@pytest.mark.asyncio
-async def test_get_daily_summary(client, fake_day, monkeypatch):
-    monkeypatch.setattr(server, "get_client", lambda: FakeClient(fake_day))
-    result = await client.call_tool("get_daily_summary", {"date": "2026-01-02"})
+def test_get_daily_summary(server_module, fake_day, monkeypatch):
+    monkeypatch.setattr(server_module, "get_client", lambda: FakeClient(fake_day))
+    result = server_module.get_daily_summary("2026-01-02")
     text = first_text(result)
     assert "Daily Summary for January 02, 2026" in text
     assert "Consumed" in text
 
 
 @pytest.mark.asyncio
-async def test_date_range_summary(client, fake_day, monkeypatch):
-    monkeypatch.setattr(server, "get_client", lambda: FakeClient(fake_day))
-    result = await client.call_tool(
-        "get_date_range_summary",
-        {"start_date": "2026-01-01", "end_date": "2026-01-03"},
-    )
+async def test_date_range_summary(server_module, fake_day, monkeypatch):
+    monkeypatch.setattr(server_module, "get_client", lambda: FakeClient(fake_day))
+    result = await server_module.get_date_range_summary("2026-01-01", "2026-01-03")
     text = first_text(result)
     assert "Date Range Summary" in text
     assert "(3 days)" in text
 
 
-@pytest.mark.asyncio
-async def test_invalid_date_error(client):
-    result = await client.call_tool("get_daily_summary", {"date": "2026/01/01"})
+def test_invalid_date_error(server_module):
+    result = server_module.get_daily_summary("2026/01/01")
     assert "Invalid date format" in first_text(result)
 
 
-@pytest.mark.asyncio
-async def test_config_error_is_generic(client, monkeypatch):
+def test_config_error_is_generic(server_module, monkeypatch):
     def _raise_config_error():
         raise ConfigError("env var not set")
 
-    monkeypatch.setattr(server, "get_client", _raise_config_error)
-    result = await client.call_tool("get_daily_summary", {})
+    monkeypatch.setattr(server_module, "get_client", _raise_config_error)
+    result = server_module.get_daily_summary()
     text = first_text(result)
     assert "configuration setup needed" in text
     assert "env var not set" in text
 
-
-def test_decorated_tool_direct_call(fake_day, monkeypatch):
-    monkeypatch.setattr(server, "get_client", lambda: FakeClient(fake_day))
-    result = server.get_daily_summary("2026-01-02")
-    assert "Daily Summary for January 02, 2026" in first_text(result)
@@ -15,10 +15,21 @@ import sys
 import random
 import string
 import hashlib
+import types
+import collections
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 
+# Lines of ffmpeg stderr kept for error reporting
+FFMPEG_STDERR_TAIL_LINES = 200
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+@functools.lru_cache(maxsize=None)
 def check_ffmpeg():
-    """Check if ffmpeg is installed."""
+    """Check if ffmpeg is installed (probed once per process)."""
     try:
         subprocess.run(
             ["ffmpeg", "-version"],
@@ -40,22 +51,34 @@ def rand_str(n):
     return ''.join(random.choices(string.ascii_letters + string.digits + '-_', k=n))
 
 
+_BASE_HEADERS = types.MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'User-Agent': _USER_AGENT,
+    'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"Windows"',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+_DOWNLOAD_HEADERS = types.MappingProxyType({
+    'User-Agent': _USER_AGENT,
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.facebook.com/',
+})
+
+# Cookie line is generated once per process and reused for every page fetch
+_SESSION_COOKIE = f'sb={rand_str(24)}; datr={rand_str(24)}; wd=1920x1080; ps_l=1; ps_n=1'
+
+
 def get_headers():
     """Get browser-like headers."""
-    return {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-        'Sec-Ch-Ua-Mobile': '?0',
-        'Sec-Ch-Ua-Platform': '"Windows"',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Upgrade-Insecure-Requests': '1',
-        'Cookie': f'sb={rand_str(24)}; datr={rand_str(24)}; wd=1920x1080; ps_l=1; ps_n=1'
-    }
+    return {**_BASE_HEADERS, 'Cookie': _SESSION_COOKIE}
 
 
 def fetch_page(url):
@@ -77,69 +100,66 @@ def fetch_page(url):
         return None
 
 
+# Extraction patterns are compiled once at import; order within each tuple is priority order
+_HD_PATTERNS = tuple(re.compile(p) for p in (
+    r'browser_native_hd_url":"(https?://[^"]+)"',
+    r'"playable_url_quality_hd":"(https?://[^"]+)"',
+    r'"hd_src":"(https?://[^"]+)"',
+    r'"hd_src_no_ratelimit":"(https?://[^"]+)"',
+))
+
+_SD_PATTERNS = tuple(re.compile(p) for p in (
+    r'browser_native_sd_url":"(https?://[^"]+)"',
+    r'"playable_url":"(https?://[^"]+)"',
+    r'"sd_src":"(https?://[^"]+)"',
+    r'"sd_src_no_ratelimit":"(https?://[^"]+)"',
+))
+
+_AUDIO_PATTERNS = tuple(re.compile(p) for p in (
+    r'"audio":\s*\{[^}]*"url":"(https?://[^"]+)"',
+    r'"audio_url":"(https?://[^"]+)"',
+    r'"audio":\s*\[\s*\{[^}]*"url":"(https?://[^"]+)"',
+))
+
+_FALLBACK_VIDEO_PATTERN = re.compile(r'https://video[^"\\]+\.mp4[^"\\]*')
+
+
+def _search_url(patterns, html):
+    """Return the first URL matched by patterns (in priority order), unescaped."""
+    for pattern in patterns:
+        match = pattern.search(html)
+        if match:
+            return match.group(1).replace('\\u0025', '%').replace('\\', '')
+    return None
+
+
 def extract_video_urls(html):
     """Extract video and audio URLs from page HTML."""
     
-    video_url = None
-    audio_url = None
-    sd_url = None
-    
     # Clean up escaped characters for regex matching
     html_clean = html.replace('\\u0025', '%').replace('\\/', '/')
     
     # Pattern 1: HD video URL (browser_native_hd_url)
-    hd_patterns = [
-        r'browser_native_hd_url":"(https?://[^"]+)"',
-        r'"playable_url_quality_hd":"(https?://[^"]+)"',
-        r'"hd_src":"(https?://[^"]+)"',
-        r'"hd_src_no_ratelimit":"(https?://[^"]+)"',
-    ]
-    
-    for pattern in hd_patterns:
-        match = re.search(pattern, html_clean)
-        if match:
-            video_url = match.group(1)
-            video_url = video_url.replace('\\u0025', '%').replace('\\', '')
-            print(f"Found HD video URL")
-            break
+    video_url = _search_url(_HD_PATTERNS, html_clean)
+    if video_url:
+        print(f"Found HD video URL")
     
     # Pattern 2: SD video URL (fallback)
-    sd_patterns = [
-        r'browser_native_sd_url":"(https?://[^"]+)"',
-        r'"playable_url":"(https?://[^"]+)"',
-        r'"sd_src":"(https?://[^"]+)"',
-        r'"sd_src_no_ratelimit":"(https?://[^"]+)"',
-    ]
-    
-    for pattern in sd_patterns:
-        match = re.search(pattern, html_clean)
-        if match:
-            sd_url = match.group(1)
-            sd_url = sd_url.replace('\\u0025', '%').replace('\\', '')
-            print(f"Found SD video URL")
-            break
+    sd_url = _search_url(_SD_PATTERNS, html_clean)
+    if sd_url:
+        print(f"Found SD video URL")
     
     # Pattern 3: Audio URL (for HD videos that have separate audio)
-    audio_patterns = [
-        r'"audio":\s*\{[^}]*"url":"(https?://[^"]+)"',
-        r'"audio_url":"(https?://[^"]+)"',
-        r'"audio":\s*\[\s*\{[^}]*"url":"(https?://[^"]+)"',
-    ]
-    
-    for pattern in audio_patterns:
-        match = re.search(pattern, html_clean)
-        if match:
-            audio_url = match.group(1)
-            audio_url = audio_url.replace('\\u0025', '%').replace('\\', '')
-            print(f"Found audio URL")
-            break
+    audio_url = _search_url(_AUDIO_PATTERNS, html_clean)
+    if audio_url:
+        print(f"Found audio URL")
     
     # Use HD if available, otherwise SD
     final_video = video_url or sd_url
     
     if not final_video:
         # Try one more approach - look for video URLs in the page
-        video_match = re.search(r'https://video[^"\\]+\.mp4[^"\\]*', html_clean)
+        video_match = _FALLBACK_VIDEO_PATTERN.search(html_clean)
         if video_match:
             final_video = video_match.group(0)
             print(f"Found video URL via fallback pattern")
@@ -151,14 +171,7 @@ def download_file(url, dest_path):
     """Download a file from URL to destination path."""
     print(f"Downloading to: {os.path.basename(dest_path)}")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': '*/*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Referer': 'https://www.facebook.com/',
-    }
-    
-    req = urllib.request.Request(url, headers=headers)
+    req = urllib.request.Request(url, headers=_DOWNLOAD_HEADERS)
     
     try:
         with urllib.request.urlopen(req, timeout=60) as response:
@@ -169,14 +182,16 @@ def download_file(url, dest_path):
             
             downloaded = 0
             chunk_size = 1024 * 1024  # 1MB chunks
-            
+            # Reuse one buffer for every chunk instead of allocating new bytes
+            buf = memoryview(bytearray(chunk_size))
+
             with open(dest_path, 'wb') as f:
                 while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
+                    n = response.readinto(buf)
+                    if not n:
                         break
-                    f.write(chunk)
-                    downloaded += len(chunk)
+                    f.write(buf[:n])
+                    downloaded += n
                     if total_size:
                         pct = (downloaded / total_size) * 100
                         print(f"\r  Progress: {pct:.1f}%", end='', flush=True)
@@ -196,25 +211,35 @@ def mux_video_audio(video_path, audio_path, output_path):
     cmd = [
         'ffmpeg',
         '-y',  # Overwrite output
-        '-i', video_path,
-        '-i', audio_path,
+        '-nostats',  # No per-frame progress on stderr
+        # Probe limits are per-input options, so repeat them for each -i
+        '-analyzeduration', '1M', '-probesize', '1M', '-i', video_path,
+        '-analyzeduration', '1M', '-probesize', '1M', '-i', audio_path,
+        '-map', '0:v:0',  # Video from the first input
+        '-map', '1:a:0',  # Audio from the second input
         '-c', 'copy',  # No re-encoding
         '-shortest',  # Match shortest stream
+        '-movflags', '+faststart',  # Put moov atom up front
         output_path
     ]
     
     try:
-        result = subprocess.run(
+        # Stream stderr and keep only the tail for error reporting
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True
-        )
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 16
+        ) as proc:
+            stderr_tail = collections.deque(proc.stderr, maxlen=FFMPEG_STDERR_TAIL_LINES)
+            returncode = proc.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("Muxing complete!")
             return True
         else:
-            print(f"FFmpeg error: {result.stderr}")
+            stderr = b''.join(stderr_tail).decode('utf-8', errors='replace')
+            print(f"FFmpeg error: {stderr}")
             return False
             
     except Exception as e:
@@ -222,9 +247,13 @@ def mux_video_audio(video_path, audio_path, output_path):
         return False
 
 
-def extract_reel_id(url):
-    """Extract reel ID from URL for output filename."""
-    parsed = urllib.parse.urlparse(url)
+def extract_reel_id(url, parsed=None):
+    """Extract reel ID from URL for output filename.
+
+    Pass an already-parsed ``parsed`` result to skip re-parsing the URL.
+    """
+    if parsed is None:
+        parsed = urllib.parse.urlparse(url)
     query = urllib.parse.parse_qs(parsed.query)
 
     # Try /reel/ID pattern
@@ -285,7 +314,7 @@ def download_reel(url, output_dir=None):
         return None
     
     # Determine output path
-    reel_id = extract_reel_id(url)
+    reel_id = extract_reel_id(url, parsed=parsed)
     output_dir = output_dir or os.getcwd()
     os.makedirs(output_dir, exist_ok=True)
     output_path = os.path.join(output_dir, f"{reel_id}.mp4")
@@ -323,23 +352,61 @@ def download_reel(url, output_dir=None):
     return output_path
 
 
+def download_reels(urls, output_dir=None, concurrency=4):
+    """Download several reels concurrently.
+
+    ffmpeg is checked once up front. Returns the output path (or None on
+    failure) for each URL, in input order.
+    """
+    if not check_ffmpeg():
+        return [None] * len(urls)
+    
+    # Different URLs for one reel (www vs bare host, extra query) write the
+    # same {reel_id}.mp4, so download each reel once and share its result
+    reel_ids = [extract_reel_id(url) for url in urls]
+    first_urls = {}
+    for reel_id, url in zip(reel_ids, urls):
+        first_urls.setdefault(reel_id, url)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = dict(zip(
+            first_urls,
+            executor.map(lambda u: download_reel(u, output_dir), first_urls.values())
+        ))
+    return [results[reel_id] for reel_id in reel_ids]
+
+
+def _looks_like_url(arg):
+    """Return True if a CLI argument is a URL rather than an output directory."""
+    return arg.lower().startswith(('http://', 'https://'))
+
+
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python scripts/fb_downloader.py <facebook_reel_url> [output_dir]")
+        print("Usage: python scripts/fb_downloader.py <facebook_reel_url> [more_urls...] [output_dir]")
         print("\nExample:")
         print("  python scripts/fb_downloader.py https://www.facebook.com/reel/830509436508428")
         sys.exit(1)
     
-    url = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    args = sys.argv[1:]
+    output_dir = None
+    if len(args) > 1 and not _looks_like_url(args[-1]):
+        output_dir = args.pop()
+    
+    if len(args) == 1:
+        results = [download_reel(args[0], output_dir)]
+    else:
+        results = download_reels(args, output_dir)
     
-    result = download_reel(url, output_dir)
+    failed = [url for url, result in zip(args, results) if not result]
     
-    if result:
+    if not failed:
         print("\nDownload successful!")
         sys.exit(0)
     else:
+        if len(args) > 1:
+            for url in failed:
+                print(f"  Failed: {url}")
         print("\nDownload failed.")
         sys.exit(1)
 
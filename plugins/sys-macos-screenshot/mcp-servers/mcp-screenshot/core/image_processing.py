@@ -3,19 +3,35 @@ from typing import Literal
 
 import cv2
 import numpy as np
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image
+
+_DETECT_MAX_EDGE = 1024
+_DETECT_MIN_SCALE = 0.5
+_SHARPEN_KERNEL = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]], dtype=np.float32)
+_BASE_SCALES = {"overview": 0.4, "readable": 0.8, "detail": 1.0}
 
 
 class ImageProcessor:
     @staticmethod
     def detect_content_regions(image: Image.Image) -> list[tuple[int, int, int, int]]:
-        img_array = np.array(image)
+        img_array = np.asarray(image)
         if len(img_array.shape) == 3:
             img_gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         else:
             img_gray = img_array
 
-        edges = cv2.Canny(img_gray, 50, 150)
+        # Qualifying regions are at least 5% of the frame, so edges found on a
+        # reduced copy are enough; boxes are mapped back to full resolution.
+        # INTER_AREA dims 1px borders by the scale factor, so the Canny
+        # thresholds shrink with it, and the reduction stops at 2x so such
+        # borders stay above the noise floor
+        scale = min(1.0, max(_DETECT_MIN_SCALE, _DETECT_MAX_EDGE / max(image.width, image.height)))
+        if scale < 1.0:
+            img_gray = cv2.resize(img_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        # External contours only: connectedComponentsWithStats would also report
+        # panels nested inside a frame, and is slower than Canny+findContours here
+        edges = cv2.Canny(img_gray, 50 * scale, 150 * scale)
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
         regions: list[tuple[int, int, int, int]] = []
@@ -24,23 +40,37 @@ class ImageProcessor:
 
         for contour in contours:
             x, y, w, h = cv2.boundingRect(contour)
+            if scale < 1.0:
+                x, y = round(x / scale), round(y / scale)
+                w, h = min(round(w / scale), image.width - x), min(round(h / scale), image.height - y)
             area = w * h
             if min_area < area < max_area and w > 100 and h > 100 and 0.3 < w / h < 3.0:
                 regions.append((x, y, w, h))
 
         regions.sort(key=lambda r: r[2] * r[3], reverse=True)
-        return regions[:3]
+
+        # A 1px border can trace separate contours for its inner and outer edge;
+        # keep one box per panel so the top three are distinct regions
+        tolerance = max(image.width, image.height) // 100
+        distinct: list[tuple[int, int, int, int]] = []
+        for region in regions:
+            if all(max(abs(a - b) for a, b in zip(region, kept)) > tolerance for kept in distinct):
+                distinct.append(region)
+                if len(distinct) == 3:
+                    break
+        return distinct
 
     @staticmethod
     def is_image_clear(image: Image.Image, threshold: float = 100.0) -> bool:
-        img_array = np.array(image.convert("L"))
-        laplacian = cv2.Laplacian(img_array, cv2.CV_64F)
-        return laplacian.var() > threshold
+        img_array = np.asarray(image if image.mode == "L" else image.convert("L"))
+        # The 3x3 Laplacian of 8-bit input fits in int16; meanStdDev avoids a float64 copy
+        laplacian = cv2.Laplacian(img_array, cv2.CV_16S)
+        _, stddev = cv2.meanStdDev(laplacian)
+        return float(stddev[0, 0]) ** 2 > threshold
 
     @staticmethod
     def get_quality_scale(mode: Literal["overview", "readable", "detail"], image_width: int = 0) -> float:
-        base_scales = {"overview": 0.4, "readable": 0.8, "detail": 1.0}
-        scale = base_scales[mode]
+        scale = _BASE_SCALES[mode]
         if image_width > 2000:
             scale *= 0.6
         elif image_width > 1600:
@@ -49,13 +79,22 @@ class ImageProcessor:
 
     @staticmethod
     def enhance_for_text(image: Image.Image) -> Image.Image:
-        img_array = np.array(image)
-        kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
-        sharpened = cv2.filter2D(img_array, -1, kernel)
+        # Every stage runs in OpenCV on one uint8 array; PIL is only touched at the end
+        img_array = np.asarray(image)
+        sharpened = cv2.filter2D(img_array, -1, _SHARPEN_KERNEL)
+
+        # Contrast x1.2 about the mean luminance, like ImageEnhance.Contrast(1.2)
+        means = cv2.mean(sharpened)
+        mean = means[0] * 0.299 + means[1] * 0.587 + means[2] * 0.114 if sharpened.ndim == 3 else means[0]
+        enhanced = cv2.addWeighted(sharpened, 1.2, sharpened, 0.0, -0.2 * int(mean + 0.5))
+        if sharpened.ndim == 3 and sharpened.shape[2] == 4:
+            enhanced[..., 3] = sharpened[..., 3]
 
-        enhanced = Image.fromarray(sharpened)
-        enhanced = ImageEnhance.Contrast(enhanced).enhance(1.2)
-        return enhanced.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
+        # UnsharpMask(radius=1, percent=150, threshold=3): skip differences below the threshold
+        blurred = cv2.GaussianBlur(enhanced, (0, 0), 1.0)
+        result = cv2.addWeighted(enhanced, 2.5, blurred, -1.5, 0)
+        np.copyto(result, enhanced, where=cv2.absdiff(enhanced, blurred) < 3)
+        return Image.fromarray(result)
 
     @staticmethod
     def process_image(
@@ -64,22 +103,31 @@ class ImageProcessor:
         enhance_text: bool,
         fmt: Literal["png", "jpeg"] = "png",
     ) -> bytes:
-        if enhance_text:
-            image = ImageProcessor.enhance_for_text(image)
-
+        # Downscale first so text enhancement only touches the pixels that are kept
         scale = ImageProcessor.get_quality_scale(quality_mode, image.width)
         if scale < 1.0:
-            image = image.resize((int(image.width * scale), int(image.height * scale)), Image.Resampling.LANCZOS)
+            # reducing_gap box-reduces large downscales before the LANCZOS pass
+            image = image.resize(
+                (int(image.width * scale), int(image.height * scale)),
+                Image.Resampling.LANCZOS,
+                reducing_gap=2.0,
+            )
+
+        if enhance_text:
+            image = ImageProcessor.enhance_for_text(image)
 
         buffer = io.BytesIO()
         if fmt == "jpeg":
-            if image.mode in ("RGBA", "LA", "P"):
+            if image.mode == "P":
+                image = image.convert("RGBA")
+            if image.mode == "RGBA" and image.getchannel("A").getextrema() == (255, 255):
+                # Fully opaque: dropping alpha matches the composite without blending every pixel
+                image = image.convert("RGB")
+            elif image.mode in ("RGBA", "LA"):
                 background = Image.new("RGB", image.size, (255, 255, 255))
-                if image.mode == "P":
-                    image = image.convert("RGBA")
                 background.paste(image, mask=image.split()[-1] if image.mode == "RGBA" else None)
                 image = background
             image.save(buffer, format="JPEG", quality=85, optimize=True)
         else:
-            image.save(buffer, format="PNG", optimize=True)
+            image.save(buffer, format="PNG", compress_level=1)
         return buffer.getvalue()
@@ -0,0 +1,32 @@
+from PIL import Image, ImageDraw
+import pytest
+
+from core.image_processing import ImageProcessor
+
+
+def _thin_outline_panels(width: int, height: int) -> tuple[Image.Image, list[tuple[int, int, int, int]]]:
+    image = Image.new("RGB", (width, height), (236, 236, 236))
+    draw = ImageDraw.Draw(image)
+    panels = [
+        (int(width * 0.08), int(height * 0.1), int(width * 0.45), int(height * 0.7)),
+        (int(width * 0.55), int(height * 0.2), int(width * 0.92), int(height * 0.85)),
+    ]
+    for panel in panels:
+        draw.rectangle(panel, outline=(0xB4, 0xB4, 0xB4), width=1)
+    return image, panels
+
+
+@pytest.mark.parametrize("size", [(1920, 1080), (2880, 1800), (3840, 2160)])
+def test_detect_content_regions_finds_thin_outline_panels(size):
+    image, panels = _thin_outline_panels(*size)
+    regions = ImageProcessor.detect_content_regions(image)
+
+    tolerance = size[0] // 100
+    for left, top, right, bottom in panels:
+        assert any(
+            abs(x - left) <= tolerance
+            and abs(y - top) <= tolerance
+            and abs(x + w - right) <= tolerance
+            and abs(y + h - bottom) <= tolerance
+            for x, y, w, h in regions
+        ), f"panel {(left, top, right, bottom)} not found in {regions}"